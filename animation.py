@@ -0,0 +1,141 @@
+"""Fixed-timestep animation of crosshair spread and overlay fade
+
+The Animator advances its state in fixed steps of 1/hz seconds, however
+late Tk runs the timer, and hands apply() a value interpolated between the
+last two steps, so motion stays smooth at 144-240 Hz. Each tick is
+scheduled against an absolute deadline, so the rounding of after() delays
+to whole milliseconds does not accumulate into drift. The loop only runs
+while something is moving.
+"""
+import math
+import time
+
+
+class Animator:
+    """Recoil spread with exponential decay and a linear fade, driven by widget.after
+
+    apply(spread, fade) receives the spread in pixels to add to the arm
+    offsets and the fade factor (0 hidden .. 1 fully shown) once per frame.
+    """
+
+    MAX_STEPS = 5
+
+    def __init__(self, widget, apply, hz=240, decay_ms=120, fade_ms=120, max_spread=12):
+        self.widget = widget
+        self.apply = apply
+        self.hz = hz
+        self.decay_ms = decay_ms
+        self.fade_ms = fade_ms
+        self.max_spread = max_spread
+        self.spread = 0.0
+        self.fade = 1.0
+        self.fade_target = 1.0
+        self.frames = 0
+        self.steps = 0
+        self.missed_frames = 0
+        self.over_budget = 0
+        self.max_tick = 0.0
+        self._previous = (0.0, 1.0)
+        self._pending = None
+        self._deadline = 0.0
+        self._last = 0.0
+        self._accumulator = 0.0
+
+    @property
+    def timestep(self):
+        return 1.0 / self.hz
+
+    @property
+    def running(self):
+        return self._pending is not None
+
+    def settled(self):
+        return self.spread == 0.0 and self.fade == self.fade_target
+
+    def kick(self, amount):
+        """Add recoil spread (in pixels), capped at max_spread"""
+        self.spread = min(self.max_spread, self.spread + amount)
+        self._start()
+
+    def fade_to(self, target):
+        """Fade towards target (0 or 1); instant when fade_ms is 0"""
+        self.fade_target = target
+        if self.fade_ms <= 0:
+            self.fade = target
+            self.apply(self.spread, self.fade)
+        self._start()
+
+    def stop(self):
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._pending = None
+
+    def stats(self):
+        return {'frames': self.frames, 'steps': self.steps, 'missed_frames': self.missed_frames,
+                'over_budget': self.over_budget, 'max_tick_ms': self.max_tick * 1000}
+
+    def _start(self):
+        if self._pending is not None or self.settled():
+            return
+        now = time.perf_counter()
+        self._last = now
+        self._accumulator = 0.0
+        self._previous = (self.spread, self.fade)
+        self._deadline = now
+        self._tick()
+
+    def _step(self, dt):
+        self._previous = (self.spread, self.fade)
+        if self.spread:
+            self.spread *= math.exp(-dt * 1000 / self.decay_ms) if self.decay_ms > 0 else 0.0
+            if self.spread < 0.05:
+                self.spread = 0.0
+        if self.fade != self.fade_target:
+            delta = dt * 1000 / self.fade_ms if self.fade_ms > 0 else 1.0
+            if self.fade < self.fade_target:
+                self.fade = min(self.fade_target, self.fade + delta)
+            else:
+                self.fade = max(self.fade_target, self.fade - delta)
+        self.steps += 1
+
+    def _tick(self):
+        start = time.perf_counter()
+        dt = self.timestep
+        # A tick a whole timestep or more behind its deadline skipped frames
+        late = start - self._deadline
+        if late >= dt:
+            self.missed_frames += int(late / dt)
+        self._accumulator += start - self._last
+        self._last = start
+        steps = 0
+        while self._accumulator >= dt and steps < self.MAX_STEPS:
+            self._step(dt)
+            self._accumulator -= dt
+            steps += 1
+        if self._accumulator >= dt:
+            # Too far behind to catch up; drop the backlog rather than spiral
+            self._accumulator %= dt
+
+        # Show the state part way between the last two steps
+        blend = self._accumulator / dt
+        spread = self._previous[0] + (self.spread - self._previous[0]) * blend
+        fade = self._previous[1] + (self.fade - self._previous[1]) * blend
+        if self.settled():
+            spread, fade = self.spread, self.fade
+        self.apply(spread, fade)
+        self.frames += 1
+
+        end = time.perf_counter()
+        elapsed = end - start
+        self.max_tick = max(self.max_tick, elapsed)
+        if elapsed > dt:
+            self.over_budget += 1
+
+        if self.settled():
+            self._pending = None
+            return
+        # Schedule against an absolute deadline so millisecond rounding does not drift
+        self._deadline += dt
+        if self._deadline < end:
+            self._deadline = end
+        self._pending = self.widget.after(max(0, round((self._deadline - end) * 1000)), self._tick)
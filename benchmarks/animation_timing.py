@@ -0,0 +1,73 @@
+"""Frame pacing of the fixed-timestep animator at high refresh rates
+
+Runs the Animator on a headless Tcl interpreter, kicking the recoil spread
+a few times per second, and reports the achieved frame rate, frame
+interval jitter and the missed-frame and over-budget counters. For
+comparison a naive loop that re-arms after(round(1000 / hz)) is timed too;
+its rounding and callback overhead add up to visible drift.
+
+Run from the repository root with ``python -m benchmarks.animation_timing``.
+"""
+import argparse
+import statistics
+import time
+import tkinter as tk
+
+from animation import Animator
+
+
+def pump(interp, seconds, every=None, action=None):
+    end = time.perf_counter() + seconds
+    next_action = time.perf_counter()
+    while time.perf_counter() < end:
+        if action and time.perf_counter() >= next_action:
+            action()
+            next_action += every
+        interp.tk.dooneevent(tk._tkinter.DONT_WAIT)
+        # Sleep a little so the loop does not spin a whole core
+        time.sleep(0.0002)
+
+
+def report(label, stamps, seconds):
+    intervals = [(b - a) * 1000 for a, b in zip(stamps, stamps[1:])]
+    if not intervals:
+        print(f"{label:>14}: no frames")
+        return
+    print(f"{label:>14}: {len(stamps) / seconds:6.1f} fps, interval mean {statistics.mean(intervals):5.2f} ms, "
+          f"stdev {statistics.pstdev(intervals):5.2f} ms, max {max(intervals):5.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=3.0)
+    args = parser.parse_args()
+    interp = tk.Tcl()
+
+    for hz in (144, 240):
+        stamps = []
+        animator = Animator(interp, lambda spread, fade: stamps.append(time.perf_counter()),
+                            hz=hz, decay_ms=400, max_spread=12)
+        # Kick often enough that the spread never settles, so the loop runs throughout
+        pump(interp, args.seconds, every=0.25, action=lambda: animator.kick(6))
+        animator.stop()
+        report(f"animator {hz} Hz", stamps, args.seconds)
+        print(" " * 16 + ", ".join(f"{key}={value:.2f}" if isinstance(value, float) else f"{key}={value}"
+                                   for key, value in animator.stats().items()))
+
+        stamps = []
+        delay = round(1000 / hz)
+
+        def naive():
+            stamps.append(time.perf_counter())
+            interp.after(delay, naive)
+
+        pending = interp.after(delay, naive)
+        pump(interp, args.seconds)
+        interp.after_cancel(pending)
+        for script in interp.tk.splitlist(interp.tk.call('after', 'info')):
+            interp.tk.call('after', 'cancel', script)
+        report(f"naive {hz} Hz", stamps, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
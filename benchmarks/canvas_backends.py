@@ -0,0 +1,83 @@
+"""Compare Tk canvas backends while cycling between a few crosshair looks
+
+Needs a display. Each backend redraws the same sequence of settings on a real
+canvas and reports how many Tcl round trips a redraw costs; the image backend
+also reports its cache counters.
+
+Run from the repository root with ``python -m benchmarks.canvas_backends``.
+"""
+import argparse
+import time
+import tkinter as tk
+from dataclasses import replace
+
+from imagecache import ImageCache, ImageRenderer
+from render import BatchedCanvasRenderer, CanvasRenderer, compile_plan
+from settings import CrosshairSettings
+
+BASE = CrosshairSettings(center_dot_enabled=True)
+LOOKS = [
+    BASE,
+    replace(BASE, inner_color='#00ff00', outer_color='#00ff00'),
+    replace(BASE, outer_enabled=False, inner_length=8),
+    replace(BASE, outer_length=50, outer_offset=30, outer_thickness=4),
+]
+
+
+class CountingTk:
+    """Stands in for canvas.tk and counts the calls that reach the Tcl interpreter"""
+
+    def __init__(self, tk):
+        self._tk = tk
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self._tk.call(*args)
+
+    def eval(self, script):
+        self.calls += 1
+        return self._tk.eval(script)
+
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
+
+
+def run(backend, canvas, frames):
+    start = time.perf_counter()
+    for frame in range(frames):
+        backend.render(compile_plan(LOOKS[frame % len(LOOKS)]), 50, 50)
+        canvas.update_idletasks()
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=2000)
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    backends = {'vector': lambda canvas: CanvasRenderer(canvas),
+                'batched': lambda canvas: BatchedCanvasRenderer(canvas)}
+    if ImageRenderer.available():
+        backends['image'] = lambda canvas: ImageRenderer(canvas, ImageCache())
+
+    for name, factory in backends.items():
+        canvas = tk.Canvas(root, width=100, height=100, bg='black', highlightthickness=0)
+        canvas.pack()
+        counter = canvas.tk = CountingTk(canvas.tk)
+        backend = factory(canvas)
+        counter.calls = 0
+        per_frame = run(backend, canvas, args.frames)
+        # run() adds one update_idletasks call per frame
+        trips = (counter.calls - args.frames) / args.frames
+        line = f"{name:>8}: {per_frame * 1e6:8.1f} us per redraw, {trips:5.2f} Tcl calls per redraw"
+        if isinstance(backend, ImageRenderer):
+            line += "  cache " + ", ".join(f"{k}={v}" for k, v in backend.cache.stats().items())
+        print(line)
+        canvas.destroy()
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
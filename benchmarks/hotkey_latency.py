@@ -0,0 +1,46 @@
+"""End-to-end hotkey latency: key press to deiconify/withdraw in toggle_visibility
+
+Drives the real overlay and HotkeyBridge with a FakeKeySource pressing the
+toggle hotkey from a background thread. Needs a display.
+
+Run from the repository root with ``python -m benchmarks.hotkey_latency``.
+"""
+import argparse
+import threading
+import time
+
+from hotkeys import FakeKeySource
+from main import CrosshairOverlay
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--presses', type=int, default=200)
+    parser.add_argument('--gap-ms', type=float, default=20.0, help="time between presses")
+    args = parser.parse_args()
+
+    app = CrosshairOverlay(persist=False)
+    app.create_overlay()
+    root = app.root
+    app.is_visible = True
+    source = FakeKeySource()
+    app.start_hotkeys(root, source=source)
+    hotkey = app.config.get('crosshair', 'hotkey_toggle')
+
+    def press_keys():
+        for _ in range(args.presses):
+            time.sleep(args.gap_ms / 1000)
+            source.press(hotkey)
+        time.sleep(0.1)
+        root.after(0, root.quit)
+
+    threading.Thread(target=press_keys, daemon=True).start()
+    root.mainloop()
+    app.hotkey_bridge.stop()
+    print(f"toggle (poll every {app.hotkey_bridge.interval_ms} ms): "
+          f"{app.hotkey_bridge.latency['toggle'].summary()}")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Event-loop wakeups and CPU time per minute with the overlay sitting idle
+
+Runs the app's periodic machinery (hotkey bridge, config watcher and, on
+Windows, the display watcher) on a headless Tcl interpreter, first as it runs while the settings window is
+open and then in idle mode, and counts how often the event loop wakes up
+and how much CPU the process uses. A hotkey pressed from the listener
+thread in idle mode checks that key presses still get through.
+
+Run from the repository root with ``python -m benchmarks.idle_wakeups``.
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+import tkinter as tk
+
+from hotkeys import FakeKeySource, HotkeyBridge, HotkeyListener
+from monitors import DisplayWatcher
+from watcher import ConfigWatcher, PollingBackend, default_backend
+
+
+def measure(interp, seconds):
+    """(wakeups, cpu seconds) of the Tcl event loop over seconds, not counting our own end timer"""
+    done = []
+    interp.after(int(seconds * 1000), lambda: done.append(True))
+    wakeups = 0
+    cpu = time.process_time()
+    while not done:
+        interp.tk.dooneevent()
+        wakeups += 1
+    return wakeups - 1, time.process_time() - cpu
+
+
+def report(label, wakeups, cpu, seconds):
+    scale = 60 / seconds
+    print(f"{label:>28}: {wakeups * scale:8.0f} wakeups/min, {cpu * scale * 1000:8.1f} ms CPU/min")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=10.0)
+    args = parser.parse_args()
+
+    interp = tk.Tcl()
+    # We drive the loop with dooneevent() rather than mainloop()
+    interp.tk.willdispatch()
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, 'config.ini')
+    with open(path, 'w') as f:
+        f.write("[crosshair]\n")
+
+    for name, backend in (('polling', PollingBackend(path)), ('default', default_backend(path))):
+        source = FakeKeySource()
+        received = []
+        bridge = HotkeyBridge(interp, HotkeyListener(source, {'F1': ('toggle', None)}),
+                              {'toggle': lambda event: received.append(time.perf_counter() - event.timestamp)})
+        watcher = ConfigWatcher(interp, path, lambda: None, backend=backend)
+        # The app only runs a display watcher where it can see layout changes
+        display = DisplayWatcher(interp, lambda monitors: None) if DisplayWatcher.supported() else None
+        bridge.start()
+        watcher.start()
+        kind = 'event-driven' if watcher.event_driven else 'polled'
+        print(f"config watcher backend: {type(backend).__name__} ({kind})")
+        print(f"display watcher: {'polled' if display else 'not started on this platform'}")
+        if display:
+            display.start()
+
+        report("settings open", *measure(interp, args.seconds), args.seconds)
+
+        bridge.set_idle(True)
+        watcher.set_idle(True)
+        if display:
+            display.set_idle(True)
+        report("idle", *measure(interp, args.seconds), args.seconds)
+
+        # A key press must still wake the idle loop
+        timer = threading.Timer(0.2, source.press, args=('F1',))
+        timer.start()
+        measure(interp, 0.5)
+        if received:
+            print(f"{'idle hotkey latency':>28}: {received[-1] * 1000:.2f} ms")
+        else:
+            print(f"{'idle hotkey latency':>28}: key press was not delivered")
+
+        bridge.stop()
+        watcher.stop()
+        if display:
+            display.stop()
+    os.remove(path)
+    os.rmdir(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Per-call cost of the --stats timing wrappers
+
+Times draw_crosshair on an app without an overlay window, so the call itself
+does almost nothing and the difference between the plain and instrumented
+runs is the wrapper's own overhead. Disabled instrumentation leaves the
+plain method in place, so the plain run is also the disabled cost.
+
+Run from the repository root with ``python -m benchmarks.instrumentation_overhead``.
+"""
+import argparse
+import time
+
+from main import CrosshairOverlay
+
+
+def time_calls(function, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=200000)
+    args = parser.parse_args()
+
+    app = CrosshairOverlay(persist=False)
+    plain = time_calls(app.draw_crosshair, args.calls)
+    # No root window here, so skip the periodic log timer
+    app.config.set('crosshair', 'stats_log_interval_s', '0')
+    app.enable_instrumentation()
+    timed = time_calls(app.draw_crosshair, args.calls)
+    print(f"disabled: {plain * 1e9:7.0f} ns per call")
+    print(f" enabled: {timed * 1e9:7.0f} ns per call (+{(timed - plain) * 1e9:.0f} ns)")
+    print(f"recorded {app.instrumentation.histogram('redraw').count} redraws")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Overlay frame-loop jitter with and without process isolation
+
+Simulates the overlay as a loop that wakes every --frame-ms, polls for new
+settings and compiles the plan, while the "settings UI" publishes a change
+every 10 ms and periodically burns CPU in chunks (standing in for layout
+passes and scrolling). In the shared-process case both run on one thread, as
+they do with a single Tk event loop; in the isolated case the overlay runs in
+its own process and reads the SharedSettingsWriter record. Runs headless.
+
+Run from the repository root with ``python -m benchmarks.isolation``.
+"""
+import argparse
+import multiprocessing
+import time
+from dataclasses import replace
+
+from render import compile_plan
+from settings import CrosshairSettings
+from shared_settings import SharedSettingsReader, SharedSettingsWriter
+
+
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def summarize(label, lateness):
+    lateness.sort()
+    pick = lambda fraction: lateness[min(len(lateness) - 1, int(fraction * len(lateness)))] * 1000
+    print(f"{label:>28}: frames {len(lateness):5d}, lateness p50 {pick(0.5):6.2f} ms, "
+          f"p99 {pick(0.99):6.2f} ms, max {lateness[-1] * 1000:6.2f} ms")
+
+
+def overlay_loop(shared_name, frame_ms, duration, results):
+    reader = SharedSettingsReader(shared_name)
+    lateness = []
+    frame = frame_ms / 1000
+    deadline = time.perf_counter() + frame
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        time.sleep(max(0.0, deadline - time.perf_counter()))
+        lateness.append(max(0.0, time.perf_counter() - deadline))
+        record = reader.poll()
+        if record:
+            compile_plan(record[0])
+        deadline += frame
+    reader.close()
+    results.put(lateness)
+
+
+def ui_work(publisher, duration, chunk_ms, on_idle=None):
+    settings = CrosshairSettings()
+    end = time.perf_counter() + duration
+    step = 0
+    while time.perf_counter() < end:
+        step += 1
+        publisher.publish(replace(settings, inner_length=1 + step % 50))
+        busy(chunk_ms / 1000)
+        if on_idle:
+            on_idle()
+        else:
+            time.sleep(0.01)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frame-ms', type=float, default=4.0)
+    parser.add_argument('--duration', type=float, default=3.0)
+    parser.add_argument('--chunk-ms', type=float, default=25.0, help="length of each simulated UI stall")
+    args = parser.parse_args()
+    frame = args.frame_ms / 1000
+
+    # Shared process: the overlay frame can only run between UI chunks
+    publisher = SharedSettingsWriter()
+    reader = SharedSettingsReader(publisher.name)
+    lateness = []
+    state = {'deadline': time.perf_counter() + frame}
+
+    def overlay_frames():
+        now = time.perf_counter()
+        while state['deadline'] <= now:
+            lateness.append(now - state['deadline'])
+            record = reader.poll()
+            if record:
+                compile_plan(record[0])
+            state['deadline'] += frame
+
+    ui_work(publisher, args.duration, args.chunk_ms, on_idle=overlay_frames)
+    reader.close()
+    summarize("shared process, busy UI", lateness)
+
+    # Isolated: the overlay process keeps its own schedule
+    results = multiprocessing.Queue()
+    for label, chunk_ms in (("isolated, idle UI", 0.0), ("isolated, busy UI", args.chunk_ms)):
+        process = multiprocessing.Process(target=overlay_loop,
+                                          args=(publisher.name, args.frame_ms, args.duration, results))
+        process.start()
+        ui_work(publisher, args.duration, chunk_ms)
+        summarize(label, results.get())
+        process.join()
+    publisher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Cost of one settings change spread over several overlay windows
+
+Creates 1, 2 and 4 overlays (as custom anchors, so no extra monitors are
+needed) and times changing a color through the redraw scheduler's single
+pass, which compiles the plan once and pushes it to every window. Reports
+plan compilations per change next to the time per change. Needs a display.
+
+Run from the repository root with ``python -m benchmarks.multi_monitor``.
+"""
+import argparse
+import time
+
+from main import CrosshairOverlay
+from render import compile_plan
+
+COLORS = ('#ff0000', '#00ff00', '#0000ff', '#ffff00')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--changes', type=int, default=1000)
+    args = parser.parse_args()
+
+    for count in (1, 2, 4):
+        app = CrosshairOverlay(persist=False)
+        anchors = "; ".join(f"{200 + 150 * index},200" for index in range(count))
+        app.config.set('crosshair', 'overlay_monitors', 'none')
+        app.config.set('crosshair', 'overlay_anchors', anchors)
+        app.create_overlay()
+        app.root.update()
+        compile_plan.cache_clear()
+
+        start = time.perf_counter()
+        for change in range(args.changes):
+            app.set_option('inner_color', COLORS[change % len(COLORS)])
+            app.request_redraw('inner')
+            app.redraw_scheduler.flush()
+            app.root.update_idletasks()
+        per_change = (time.perf_counter() - start) / args.changes
+        misses = compile_plan.cache_info().misses
+        print(f"{count} overlay(s): {per_change * 1e6:8.1f} us per change, "
+              f"{misses} plan compilations for {args.changes} changes")
+        app.root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Blended overlay area: fixed 100x100 window vs. the auto-sized window
+
+The compositor alpha-blends every pixel of the layered overlay window each
+frame, so the window area is a direct proxy for compositing cost. Also flags
+presets that the old fixed window clipped.
+
+Run from the repository root with ``python -m benchmarks.overlay_area``.
+"""
+import configparser
+import os
+from dataclasses import replace
+
+from render import compile_plan, overlay_size, plan_extent
+from settings import CrosshairSettings
+
+FIXED_SIZE = 100
+BASE = CrosshairSettings()
+
+
+def presets():
+    yield 'defaults', BASE
+    config = configparser.ConfigParser()
+    if config.read(os.path.join(os.path.dirname(__file__), os.pardir, 'config.ini')):
+        yield 'config.ini', CrosshairSettings.from_config(config)
+    yield '1px dot', replace(BASE, inner_enabled=False, outer_enabled=False,
+                             center_dot_enabled=True, center_dot_size=1,
+                             center_dot_outline_enabled=False)
+    yield 'inner only', replace(BASE, outer_enabled=False)
+    yield 'long outer', replace(BASE, outer_length=50, outer_offset=30)
+    yield 'slider maxima', replace(BASE, inner_length=50, inner_offset=20, inner_thickness=10,
+                                   outer_length=50, outer_offset=30, outer_thickness=10,
+                                   center_dot_enabled=True, center_dot_size=10)
+
+
+def main():
+    print(f"{'preset':<16}{'fixed px':>10}{'sized px':>10}{'ratio':>8}  clipped before")
+    for name, settings in presets():
+        plan = compile_plan(settings)
+        size = overlay_size(plan)
+        clipped = plan_extent(plan) > FIXED_SIZE // 2
+        print(f"{name:<16}{FIXED_SIZE * FIXED_SIZE:>10}{size * size:>10}"
+              f"{size * size / (FIXED_SIZE * FIXED_SIZE):>8.2f}  {'yes' if clipped else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
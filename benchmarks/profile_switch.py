@@ -0,0 +1,86 @@
+"""Profile switch latency with many stored profiles
+
+Builds a throwaway config.ini with --profiles random profiles, then times
+switch_profile between them. The core path (config + settings swap) always
+runs; if a display is available the overlay is created and the timing
+includes pushing the precompiled plan to the canvas.
+
+Run from the repository root with ``python -m benchmarks.profile_switch``.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import tkinter as tk
+
+from main import CrosshairOverlay
+
+RANGES = {
+    'inner_length': (1, 50), 'inner_thickness': (1, 10), 'inner_offset': (0, 20),
+    'outer_length': (1, 50), 'outer_thickness': (1, 10), 'outer_offset': (0, 30),
+    'center_dot_size': (1, 10),
+}
+
+
+def random_look(app, rng):
+    for key, (low, high) in RANGES.items():
+        app.set_option(key, rng.randint(low, high))
+    for key in ('inner_enabled', 'outer_enabled', 'center_dot_enabled'):
+        app.set_option(key, rng.random() < 0.7)
+    for key in ('inner_color', 'outer_color', 'center_dot_color'):
+        app.set_option(key, f"#{rng.randrange(1 << 24):06x}")
+
+
+def time_switches(app, names, switches, rng):
+    samples = []
+    for _ in range(switches):
+        name = rng.choice(names)
+        start = time.perf_counter()
+        app.switch_profile(name)
+        if app.overlays:
+            app.root.update_idletasks()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples
+
+
+def report(label, samples):
+    mean = sum(samples) / len(samples)
+    p99 = samples[min(len(samples) - 1, int(0.99 * len(samples)))]
+    print(f"{label:>22}: mean {mean * 1e6:7.1f} us, p50 {samples[len(samples) // 2] * 1e6:7.1f} us, "
+          f"p99 {p99 * 1e6:7.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profiles', type=int, default=60)
+    parser.add_argument('--switches', type=int, default=5000)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        app = CrosshairOverlay()
+        for index in range(args.profiles):
+            random_look(app, rng)
+            app.save_profile(f"profile {index}")
+
+        start = time.perf_counter()
+        app.profiles.load(app.config)
+        print(f"compiled {len(app.profiles)} profiles in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        names = app.profiles.names()
+        report("core switch", time_switches(app, names, args.switches, rng))
+        try:
+            app.create_overlay()
+        except tk.TclError as error:
+            print(f"no display, skipping overlay switch timing ({error})")
+        else:
+            report("switch + canvas update", time_switches(app, names, args.switches, rng))
+            app.root.destroy()
+        app.config_writer.close()
+
+
+if __name__ == "__main__":
+    main()
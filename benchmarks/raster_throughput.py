@@ -0,0 +1,79 @@
+"""Headless rendering benchmark using the offscreen NumPy rasterizer
+
+Runs without a display. For each configuration in the matrix it reports
+renders per second and per-frame latency percentiles, both for rasterizing a
+cached plan and for the full compile + rasterize path.
+
+Run from the repository root with ``python -m benchmarks.raster_throughput``.
+"""
+import argparse
+import time
+from dataclasses import replace
+
+from raster import rasterize
+from render import compile_plan, overlay_size
+from settings import CrosshairSettings
+
+BASE = CrosshairSettings()
+
+MATRIX = {
+    'defaults': BASE,
+    'dot only': replace(BASE, inner_enabled=False, outer_enabled=False,
+                        center_dot_enabled=True, center_dot_size=1),
+    'all layers': replace(BASE, center_dot_enabled=True),
+    'no outlines': replace(BASE, inner_outline_enabled=False, outer_outline_enabled=False),
+    'long outer': replace(BASE, outer_length=50, outer_offset=30),
+    'thick outlines': replace(BASE, inner_thickness=10, outer_thickness=10,
+                              inner_outline_thickness=5, outer_outline_thickness=5,
+                              center_dot_enabled=True, center_dot_size=10,
+                              center_dot_outline_thickness=5),
+    'extreme': replace(BASE, inner_length=50, inner_offset=20, inner_thickness=10,
+                       outer_length=50, outer_offset=30, outer_thickness=10,
+                       inner_outline_thickness=5, outer_outline_thickness=5,
+                       center_dot_enabled=True, center_dot_size=10),
+}
+
+
+def percentile(sorted_samples, fraction):
+    index = min(len(sorted_samples) - 1, int(fraction * len(sorted_samples)))
+    return sorted_samples[index]
+
+
+def measure(frame, frames):
+    samples = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        frame()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        'fps': len(samples) / sum(samples),
+        'p50': percentile(samples, 0.50) * 1e6,
+        'p95': percentile(samples, 0.95) * 1e6,
+        'p99': percentile(samples, 0.99) * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=2000, help="frames per configuration")
+    args = parser.parse_args()
+
+    print(f"{'configuration':<16}{'path':<18}{'size':>6}{'renders/s':>12}"
+          f"{'p50 us':>9}{'p95 us':>9}{'p99 us':>9}")
+    for name, settings in MATRIX.items():
+        plan = compile_plan(settings)
+        size = overlay_size(plan)
+        buffer = rasterize(plan, size)
+        paths = {
+            'rasterize': lambda: rasterize(plan, size, out=buffer),
+            'compile+raster': lambda: rasterize(compile_plan.__wrapped__(settings), size, out=buffer),
+        }
+        for path, frame in paths.items():
+            result = measure(frame, args.frames)
+            print(f"{name:<16}{path:<18}{size:>6}{result['fps']:>12.0f}"
+                  f"{result['p50']:>9.1f}{result['p95']:>9.1f}{result['p99']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Micro-benchmark: reading draw settings from ConfigParser vs CrosshairSettings
+
+Run from the repository root with ``python -m benchmarks.settings_lookup``.
+"""
+import configparser
+import timeit
+
+from settings import SECTION, CrosshairSettings
+
+
+def read_from_config(config):
+    """Mirror the lookups draw_crosshair used to do on every redraw"""
+    get = config.get
+    getboolean = config.getboolean
+    values = []
+    for layer in ('outer', 'inner'):
+        if getboolean(SECTION, f'{layer}_enabled'):
+            values.append(int(get(SECTION, f'{layer}_length')))
+            values.append(int(get(SECTION, f'{layer}_thickness')))
+            values.append(int(get(SECTION, f'{layer}_offset')))
+            values.append(get(SECTION, f'{layer}_color'))
+            if getboolean(SECTION, f'{layer}_outline_enabled'):
+                values.append(int(get(SECTION, f'{layer}_outline_thickness')))
+                values.append(get(SECTION, f'{layer}_outline_color'))
+    if getboolean(SECTION, 'center_dot_enabled'):
+        values.append(int(get(SECTION, 'center_dot_size')))
+        values.append(get(SECTION, 'center_dot_color'))
+        if getboolean(SECTION, 'center_dot_outline_enabled'):
+            values.append(int(get(SECTION, 'center_dot_outline_thickness')))
+            values.append(get(SECTION, 'center_dot_outline_color'))
+    values.append(float(get(SECTION, 'opacity')))
+    return values
+
+
+def read_from_snapshot(s):
+    """The same reads against the pre-parsed snapshot"""
+    values = []
+    if s.outer_enabled:
+        values += (s.outer_length, s.outer_thickness, s.outer_offset, s.outer_color)
+        if s.outer_outline_enabled:
+            values += (s.outer_outline_thickness, s.outer_outline_color)
+    if s.inner_enabled:
+        values += (s.inner_length, s.inner_thickness, s.inner_offset, s.inner_color)
+        if s.inner_outline_enabled:
+            values += (s.inner_outline_thickness, s.inner_outline_color)
+    if s.center_dot_enabled:
+        values += (s.center_dot_size, s.center_dot_color)
+        if s.center_dot_outline_enabled:
+            values += (s.center_dot_outline_thickness, s.center_dot_outline_color)
+    values.append(s.opacity)
+    return values
+
+
+def main():
+    config = configparser.ConfigParser()
+    config.add_section(SECTION)
+    defaults = CrosshairSettings(center_dot_enabled=True)
+    for key in CrosshairSettings.__slots__:
+        config.set(SECTION, key, str(getattr(defaults, key)))
+    snapshot = CrosshairSettings.from_config(config)
+    assert read_from_config(config) == read_from_snapshot(snapshot)
+
+    number = 20000
+    for label, func, arg in (("configparser", read_from_config, config),
+                             ("snapshot", read_from_snapshot, snapshot)):
+        best = min(timeit.repeat(lambda: func(arg), number=number, repeat=5))
+        print(f"{label:>12}: {best / number * 1e6:8.2f} us per redraw's worth of lookups")
+
+
+if __name__ == "__main__":
+    main()
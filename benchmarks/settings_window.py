@@ -0,0 +1,53 @@
+"""Settings window open time and live Tcl variables/traces, lazy vs. fully expanded
+
+The lazy run opens the window as the app does, with every section
+collapsed; the expanded run also opens every section, which builds the
+same widgets the window used to create up front. Needs a display.
+
+Run from the repository root with ``python -m benchmarks.settings_window``.
+"""
+import argparse
+import statistics
+import time
+
+from main import CrosshairOverlay
+
+
+def tcl_variables(interp):
+    """(variables, traces) for the Tk variables tkinter created"""
+    names = [str(name) for name in interp.tk.splitlist(interp.tk.call('info', 'globals'))]
+    names = [name for name in names if name.startswith('PY_VAR')]
+    traces = sum(len(interp.tk.splitlist(interp.tk.call('trace', 'info', 'variable', name)))
+                 for name in names)
+    return len(names), traces
+
+
+def open_settings(expand):
+    app = CrosshairOverlay(persist=False)
+    app.create_root()
+    start = time.perf_counter()
+    app.show_settings()
+    if expand:
+        for name in app.sections:
+            app.toggle_section(name, expand=True)
+    app.root.update()
+    elapsed = time.perf_counter() - start
+    counts = tcl_variables(app.root)
+    app.root.destroy()
+    return elapsed, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--samples', type=int, default=10)
+    args = parser.parse_args()
+
+    for label, expand in (('lazy', False), ('expanded', True)):
+        samples = [open_settings(expand) for _ in range(args.samples)]
+        variables, traces = samples[-1][1]
+        print(f"{label:>9}: open {statistics.median(s[0] for s in samples) * 1000:7.1f} ms (median), "
+              f"{variables} Tcl variables, {traces} traces")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Share code round-trip check and encode/decode throughput
+
+Checks, for many random looks within the shareable ranges, that decoding
+an encoded look gives the same look back and re-encoding gives the same
+code, and that out-of-range values and corrupted codes are rejected. Then
+times encode and decode.
+
+Run from the repository root with ``python -m benchmarks.sharecode``.
+"""
+import argparse
+import configparser
+import random
+import time
+from dataclasses import replace
+
+import sharecode
+from settings import SECTION, CrosshairSettings, opacity_from_percent
+
+
+def random_look(rng):
+    """A random look within the shareable ranges, built from config strings like the app's"""
+    config = configparser.ConfigParser()
+    config.add_section(SECTION)
+    for key, kind in sharecode.LAYOUT_V1:
+        low, high = sharecode.limits(key, kind)
+        number = rng.randint(low, high)
+        if kind == 'bool':
+            value = str(bool(number))
+        elif kind == 'color':
+            # Config files may spell colors in either case
+            value = f"#{number:06x}" if rng.random() < 0.5 else f"#{number:06X}"
+        elif kind == 'percent':
+            value = opacity_from_percent(number)
+        else:
+            value = str(number)
+        config.set(SECTION, key, value)
+    return CrosshairSettings.from_config(config)
+
+def check_round_trips(rng, looks):
+    look = CrosshairSettings()
+    assert sharecode.decode(sharecode.encode(look)) == look, "default look"
+    for _ in range(looks):
+        look = random_look(rng)
+        code = sharecode.encode(look)
+        decoded = sharecode.decode(code)
+        assert decoded == look, (look, decoded)
+        assert sharecode.encode(decoded) == code, code
+
+    # Every number at both ends of its range
+    base = random_look(rng)
+    for key, kind in sharecode.LAYOUT_V1:
+        if kind in ('int', 'percent'):
+            low, high = sharecode.limits(key, kind)
+            for number in (low, high):
+                value = max(1, number) / 100 if kind == 'percent' else number
+                look = replace(base, **{key: value})
+                assert sharecode.decode(sharecode.encode(look)) == look, (key, value)
+
+def check_rejections(rng, codes):
+    for key, kind in sharecode.LAYOUT_V1:
+        if kind == 'int':
+            low, high = sharecode.limits(key, kind)
+            for value in (low - 1, high + 1):
+                try:
+                    sharecode.encode(replace(CrosshairSettings(), **{key: value}))
+                except ValueError:
+                    continue
+                raise AssertionError(f"{key} = {value} was encoded")
+
+    detected = 0
+    for _ in range(codes):
+        code = list(sharecode.encode(random_look(rng)))
+        position = rng.randrange(len(code))
+        code[position] = rng.choice(sharecode.ALPHABET.replace(code[position], ''))
+        try:
+            sharecode.decode(''.join(code))
+        except ValueError:
+            detected += 1
+    return detected
+
+
+def throughput(function, argument, seconds=1.0):
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for _ in range(100):
+            function(argument)
+        calls += 100
+    return calls / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--looks', type=int, default=20000)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    check_round_trips(rng, args.looks)
+    print(f"round trip: {args.looks} random looks and every range limit ok")
+    detected = check_rejections(rng, args.looks)
+    print(f"rejections: out-of-range values refused, {detected}/{args.looks} "
+          f"single-character typos detected ({detected / args.looks:.1%})")
+
+    look = random_look(rng)
+    code = sharecode.encode(look)
+    print(f"sample code ({len(code)} chars): {code}")
+    print(f"encode: {throughput(sharecode.encode, look):10.0f} codes/s")
+    print(f"decode: {throughput(sharecode.decode, code):10.0f} codes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Startup cost of the full UI vs. --overlay-only
+
+Each sample runs in a fresh interpreter and measures the import time of main
+and the time until the first crosshair frame has been drawn (the Tk event
+queue drained after creating the overlay, plus the settings window in full
+mode). Needs a display. Each sample runs in a temporary directory with a
+copy of config.ini, so loading the config is measured without changing it.
+
+Run from the repository root with ``python -m benchmarks.startup``.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SNIPPET = """
+import json, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+app = main.CrosshairOverlay()
+app.create_root()
+app.create_overlay()
+app.is_visible = True
+if {full!r}:
+    app.show_settings()
+app.root.update()
+first_frame = time.perf_counter()
+print(json.dumps({{'import': imported - start, 'first_frame': first_frame - start}}))
+app.config_writer.close()
+app.root.destroy()
+"""
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+
+def sample(full):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (ROOT, os.environ.get('PYTHONPATH')))))
+    with tempfile.TemporaryDirectory() as workdir:
+        config = os.path.join(ROOT, 'config.ini')
+        if os.path.exists(config):
+            shutil.copy(config, workdir)
+        output = subprocess.run([sys.executable, '-c', SNIPPET.format(full=full)],
+                                cwd=workdir, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    for label, full in (('full UI', True), ('overlay-only', False)):
+        samples = [sample(full) for _ in range(args.runs)]
+        imports = statistics.median(s['import'] for s in samples) * 1000
+        frames = statistics.median(s['first_frame'] for s in samples) * 1000
+        print(f"{label:>13}: import {imports:7.1f} ms, first frame {frames:7.1f} ms (median of {args.runs})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""Global hotkeys delivered into the Tk main loop
+
+A key source runs on a background thread and reports key presses. The
+HotkeyListener turns them into timestamped events on a collections.deque,
+whose append/popleft are atomic in CPython, so the listener thread never
+takes a lock or touches Tk. HotkeyBridge drains the deque from a short
+after() pump on the Tk thread and dispatches events to handlers. While the
+app is idle the pump is stopped and the listener thread wakes the Tk loop
+for each event instead (Tk marshals calls from other threads when Tcl is
+built with thread support, as it is in standard Python builds).
+"""
+import logging
+import sys
+import threading
+import time
+from collections import deque, namedtuple
+from tkinter import TclError
+
+logger = logging.getLogger(__name__)
+
+HotkeyEvent = namedtuple('HotkeyEvent', 'kind payload timestamp')
+
+
+def parse_hotkey(text):
+    """Split 'Ctrl+Shift+F1' into (frozenset of modifiers, key name)"""
+    parts = [part.strip() for part in text.split('+') if part.strip()]
+    if not parts:
+        raise ValueError(f"Empty hotkey: {text!r}")
+    modifiers = frozenset(part.lower() for part in parts[:-1])
+    unknown = modifiers - {'ctrl', 'alt', 'shift', 'win'}
+    if unknown:
+        raise ValueError(f"Unknown modifier(s) in {text!r}: {', '.join(sorted(unknown))}")
+    return modifiers, parts[-1].upper()
+
+
+class FakeKeySource:
+    """Key source driven by press() calls, for tests and headless benchmarks"""
+
+    def __init__(self):
+        self._on_key = None
+        self._stopped = threading.Event()
+
+    def run(self, hotkeys, on_key):
+        self._on_key = on_key
+        self._stopped.wait()
+
+    def stop(self):
+        self._stopped.set()
+
+    def press(self, hotkey):
+        """Simulate a key press; may be called from any thread"""
+        if self._on_key is not None:
+            self._on_key(hotkey)
+
+
+class WindowsKeySource:
+    """Key source using RegisterHotKey and a Win32 message loop"""
+
+    MODIFIERS = {'alt': 0x0001, 'ctrl': 0x0002, 'shift': 0x0004, 'win': 0x0008}
+    MOD_NOREPEAT = 0x4000
+    WM_HOTKEY = 0x0312
+    WM_QUIT = 0x0012
+
+    def __init__(self):
+        self._thread_id = None
+
+    @staticmethod
+    def virtual_key(name):
+        if len(name) == 1 and name.isalnum():
+            return ord(name)
+        if name.startswith('F') and name[1:].isdigit() and 1 <= int(name[1:]) <= 24:
+            return 0x70 + int(name[1:]) - 1
+        raise ValueError(f"Unsupported hotkey: {name!r}")
+
+    def run(self, hotkeys, on_key):
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+        self._thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+        registered = []
+        msg = wintypes.MSG()
+        try:
+            for hotkey_id, hotkey in enumerate(hotkeys, start=1):
+                try:
+                    modifiers, name = parse_hotkey(hotkey)
+                    key = self.virtual_key(name)
+                except ValueError as error:
+                    # One bad binding must not take the others down with it
+                    logger.warning("Ignoring hotkey %s: %s", hotkey, error)
+                    continue
+                flags = self.MOD_NOREPEAT
+                for modifier in modifiers:
+                    flags |= self.MODIFIERS[modifier]
+                if user32.RegisterHotKey(None, hotkey_id, flags, key):
+                    registered.append(hotkey_id)
+                else:
+                    logger.warning("Could not register hotkey %s (already in use?)", hotkey)
+
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == self.WM_HOTKEY and 1 <= msg.wParam <= len(hotkeys):
+                    on_key(hotkeys[msg.wParam - 1])
+        finally:
+            for hotkey_id in registered:
+                user32.UnregisterHotKey(None, hotkey_id)
+
+    def stop(self):
+        if self._thread_id is not None:
+            import ctypes
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, self.WM_QUIT, 0, 0)
+
+
+def default_key_source():
+    """The platform's global hotkey source, or None if there isn't one"""
+    if sys.platform == 'win32':
+        return WindowsKeySource()
+    return None
+
+
+class HotkeyListener:
+    """Background thread that turns key presses into queued HotkeyEvents"""
+
+    def __init__(self, source, bindings):
+        # bindings maps a hotkey string to the (kind, payload) event it sends
+        self.source = source
+        self.bindings = dict(bindings)
+        self.events = deque()
+        # Called on the listener thread after each queued event, if set
+        self.on_event = None
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.source.run, args=(list(self.bindings), self._on_key),
+            name="hotkey-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.source.stop()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _on_key(self, hotkey):
+        binding = self.bindings.get(hotkey)
+        if binding is not None:
+            kind, payload = binding
+            self.events.append(HotkeyEvent(kind, payload, time.perf_counter()))
+            on_event = self.on_event
+            if on_event is not None:
+                on_event()
+
+
+class LatencyStats:
+    """Running count/mean/max plus a window of recent samples for percentiles"""
+
+    def __init__(self, window=256):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=window)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.recent.append(seconds)
+
+    def percentile(self, fraction):
+        if not self.recent:
+            return 0.0
+        samples = sorted(self.recent)
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+    def summary(self):
+        mean = self.total / self.count if self.count else 0.0
+        return (f"{self.count} events, mean {mean * 1000:.2f} ms, "
+                f"p95 {self.percentile(0.95) * 1000:.2f} ms, max {self.max * 1000:.2f} ms")
+
+
+class HotkeyBridge:
+    """Tk-side pump that drains a HotkeyListener and dispatches its events
+
+    Each handler receives the HotkeyEvent; the time from key press to the
+    handler returning is recorded per event kind in latency.
+    """
+
+    def __init__(self, widget, listener, handlers, interval_ms=5, idle_interval_ms=100):
+        self.widget = widget
+        self.listener = listener
+        self.handlers = handlers
+        self.interval_ms = interval_ms
+        # Only used while idle if Tcl cannot be called from the listener thread
+        self.idle_interval_ms = idle_interval_ms
+        self.latency = {}
+        self.idle = False
+        self._pending = None
+
+    def start(self):
+        self.listener.start()
+        self._schedule()
+
+    def stop(self):
+        self.listener.on_event = None
+        self._cancel()
+        self.listener.stop()
+
+    def set_idle(self, idle):
+        """Stop polling while idle and let the listener thread wake the Tk loop instead"""
+        if idle == self.idle:
+            return
+        self.idle = idle
+        self._cancel()
+        if idle and self._can_wake():
+            self.listener.on_event = self._wake
+            # An event queued before on_event was set would otherwise wait for the next one
+            if self.listener.events:
+                self._wake()
+        else:
+            self.listener.on_event = None
+            self._schedule()
+
+    def _can_wake(self):
+        return self.widget.tk.eval('info exists tcl_platform(threaded)') == '1'
+
+    def _schedule(self):
+        interval = self.idle_interval_ms if self.idle else self.interval_ms
+        self._pending = self.widget.after(interval, self._pump)
+
+    def _cancel(self):
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._pending = None
+
+    def _wake(self):
+        # Listener thread: Tk runs the callback on its own thread
+        try:
+            self.widget.after(0, self._drain)
+        except (RuntimeError, TclError) as error:
+            logger.debug("Could not wake the Tk loop for a hotkey: %s", error)
+
+    def _pump(self):
+        self._drain()
+        self._schedule()
+
+    def _drain(self):
+        events = self.listener.events
+        while events:
+            event = events.popleft()
+            handler = self.handlers.get(event.kind)
+            if handler is None:
+                logger.debug("No handler for hotkey event %s", event.kind)
+                continue
+            handler(event)
+            stats = self.latency.setdefault(event.kind, LatencyStats())
+            stats.add(time.perf_counter() - event.timestamp)
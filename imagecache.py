@@ -0,0 +1,109 @@
+"""Pre-rasterized crosshair images shown as a single canvas item
+
+ImageRenderer is an alternative to CanvasRenderer: each distinct render plan
+is rasterized once with the offscreen renderer, turned into a PhotoImage and
+kept in a memory-capped LRU, so redrawing a previously seen look is a single
+itemconfigure that swaps the image.
+"""
+import base64
+import struct
+import tkinter as tk
+import zlib
+from collections import OrderedDict
+
+import raster
+
+
+def encode_png(rgba):
+    """Encode an RGBA uint8 array as PNG bytes (unfiltered, stdlib zlib only)"""
+    height, width = rgba.shape[:2]
+    rows = raster.np.zeros((height, width * 4 + 1), dtype=raster.np.uint8)
+    rows[:, 1:] = rgba.reshape(height, width * 4)
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack('>I', len(data)) + body + struct.pack('>I', zlib.crc32(body))
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(rows.tobytes(), 1)) + chunk(b'IEND', b''))
+
+
+class ImageCache:
+    """LRU of PhotoImages keyed by render plan, bounded by an estimated byte size"""
+
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, plan, master=None):
+        """Return the (image, size) for a plan, rasterizing it on a miss"""
+        entry = self._entries.get(plan)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(plan)
+            return entry[0], entry[1]
+
+        self.misses += 1
+        pixels = raster.rasterize(plan)
+        size = pixels.shape[0]
+        image = tk.PhotoImage(master=master, format='png',
+                              data=base64.b64encode(encode_png(pixels)))
+        cost = size * size * 4
+        self._entries[plan] = (image, size, cost)
+        self.bytes += cost
+        self._evict()
+        return image, size
+
+    def _evict(self):
+        # Always keep the newest entry, even if it alone exceeds the cap
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, _, cost) = self._entries.popitem(last=False)
+            self.bytes -= cost
+            self.evictions += 1
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'entries': len(self._entries), 'bytes': self.bytes}
+
+
+class ImageRenderer:
+    """Canvas backend that displays a cached, pre-rasterized image of the plan"""
+
+    def __init__(self, canvas, cache=None):
+        self.canvas = canvas
+        self.cache = cache if cache is not None else ImageCache()
+        self.item = canvas.create_image(0, 0, anchor='nw', state='hidden')
+        self._image = None
+        self._origin = None
+
+    @staticmethod
+    def available():
+        return raster.np is not None
+
+    def render(self, plan, center_x, center_y, layers=None):
+        """Swap in the image for plan, touching the canvas only when something changed
+
+        The image always covers every layer, so layers is accepted but unused.
+        """
+        if not plan:
+            if self._image is not None:
+                self.canvas.itemconfigure(self.item, state='hidden')
+                self._image = None
+            return
+        image, size = self.cache.get(plan, master=self.canvas)
+        # The rasterizer puts the crosshair center at size // 2
+        origin = (center_x - size // 2, center_y - size // 2)
+        if origin != self._origin:
+            self.canvas.coords(self.item, *origin)
+            self._origin = origin
+        if image is not self._image:
+            self.canvas.itemconfigure(self.item, image=image, state='normal')
+            self._image = image
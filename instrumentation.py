@@ -0,0 +1,152 @@
+"""Optional runtime counters and latency histograms for the overlay
+
+Instrumentation is opt-in: nothing is measured until wrap() replaces a
+method on one instance with a timing wrapper, so with instrumentation
+disabled the app runs its plain methods and pays nothing. Collected data
+can be logged periodically, shown in the settings window and dumped as
+JSON on exit.
+"""
+import json
+import logging
+import time
+from bisect import bisect_left
+from functools import wraps
+
+logger = logging.getLogger(__name__)
+
+# Upper bucket bounds in microseconds; the last bucket catches everything slower
+BUCKET_BOUNDS_US = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000)
+
+
+class Histogram:
+    """Fixed-bucket histogram with count, total and max"""
+
+    def __init__(self, bounds=BUCKET_BOUNDS_US):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, value):
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of samples, capped at max"""
+        if not self.count:
+            return 0
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target and count:
+                return min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self):
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {'count': self.count, 'mean': self.mean, 'max': self.max,
+                'p50': self.percentile(0.5), 'p95': self.percentile(0.95),
+                'buckets': dict(zip(labels, self.buckets))}
+
+
+class Instrumentation:
+    """Named duration histograms (in microseconds) and trace fan-out per user action"""
+
+    def __init__(self):
+        self.timings = {}
+        self.fanout = Histogram(bounds=(1, 2, 4, 8, 16, 32, 64))
+        self.started = time.perf_counter()
+        self._action_callbacks = 0
+        self._log_pending = None
+
+    def histogram(self, name):
+        histogram = self.timings.get(name)
+        if histogram is None:
+            histogram = self.timings[name] = Histogram()
+        return histogram
+
+    def wrap(self, obj, method, name=None):
+        """Time every call of obj.method into the histogram name (default: the method name)
+
+        The method may run on another thread as long as only that thread calls it.
+        """
+        histogram = self.histogram(name or method)
+        original = getattr(obj, method)
+
+        @wraps(original)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                histogram.add((time.perf_counter() - start) * 1e6)
+
+        setattr(obj, method, timed)
+
+    def wrap_fanout(self, obj, method, widget):
+        """Count calls of obj.method per user action
+
+        An action is everything Tk runs before it next goes idle, so the
+        callbacks fired by one slider step or keystroke are counted together.
+        """
+        original = getattr(obj, method)
+
+        @wraps(original)
+        def counted(*args, **kwargs):
+            if not self._action_callbacks:
+                widget.after_idle(self._end_action)
+            self._action_callbacks += 1
+            return original(*args, **kwargs)
+
+        setattr(obj, method, counted)
+
+    def _end_action(self):
+        self.fanout.add(self._action_callbacks)
+        self._action_callbacks = 0
+
+    def snapshot(self, extra=None):
+        """All collected data as a JSON-ready dict; extra adds other components' stats"""
+        data = {
+            'uptime_s': time.perf_counter() - self.started,
+            'timings_us': {name: histogram.to_dict() for name, histogram in self.timings.items()},
+            'trace_fanout': self.fanout.to_dict(),
+        }
+        if extra:
+            data.update(extra)
+        return data
+
+    def summary(self):
+        """One log line with count, mean, p95 and max of every timing"""
+        parts = [f"{name} {histogram.count}x mean {histogram.mean:.0f} us "
+                 f"p95 {histogram.percentile(0.95):.0f} us max {histogram.max:.0f} us"
+                 for name, histogram in self.timings.items() if histogram.count]
+        if self.fanout.count:
+            parts.append(f"trace fan-out {self.fanout.count} actions mean {self.fanout.mean:.1f} "
+                         f"max {self.fanout.max}")
+        return "; ".join(parts) or "no activity"
+
+    def start_logging(self, widget, interval_ms):
+        """Log summary() every interval_ms from widget's event loop"""
+        def log():
+            logger.info("stats: %s", self.summary())
+            self._log_pending = widget.after(interval_ms, log)
+
+        self._log_pending = widget.after(interval_ms, log)
+
+    def stop_logging(self, widget):
+        if self._log_pending is not None:
+            widget.after_cancel(self._log_pending)
+            self._log_pending = None
+
+    def dump(self, path, extra=None):
+        with open(path, 'w') as f:
+            json.dump(self.snapshot(extra), f, indent=2)
@@ -1,16 +1,71 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import argparse
 import configparser
+import logging
+import multiprocessing
 import os
 import sys
+import time
+
+from animation import Animator
+from hotkeys import HotkeyBridge, HotkeyListener, default_key_source
+from instrumentation import Instrumentation
+from monitors import DisplayWatcher, enumerate_monitors, overlay_anchors
+from overlays import Overlay
+from persistence import ConfigWriter
+from profiles import PROFILE_PREFIX, ProfileStore
+from render import LAYERS, BatchedCanvasRenderer, CanvasRenderer, compile_plan, overlay_size, spread_plan
+from scheduler import RedrawScheduler
+from schema import SECTIONS
+import sharecode
+from shared_settings import SharedSettingsReader, SharedSettingsWriter
+from watcher import ConfigWatcher
+from settings import (
+    KEY_LAYERS, LEGACY_KEYS, SECTION, CrosshairSettings, SettingsModel, changed_layers,
+    opacity_from_percent, percent_from_opacity, rgb_to_hex
+)
+
+CONFIG_FILE = 'config.ini'
+
+logger = logging.getLogger(__name__)
 
 class CrosshairOverlay:
-    def __init__(self):
+    def __init__(self, persist=True):
         self.root = None
-        self.overlay_window = None
+        self.settings_built = False
+        self.quit_on_settings_close = True
+        self.overlays = []
+        self.monitors = []
+        self.display_watcher = None
+        self.image_cache = None
         self.is_visible = False
+        self.redraw_scheduler = None
+        self.animator = None
+        self.spread = 0
+        self.fade = 1.0
+        self.window_size = None
+        self.hotkey_bridge = None
+        self.settings_model = None
+        self.config_watcher = None
+        self.settings_publisher = None
+        self.settings_reader = None
+        self.overlay_process = None
+        self.remote_toggles = 0
+        self.shared_changed_at = 0.0
+        self.idle = False
+        self.instrumentation = None
+        self.stats_json = None
+        self.stats_var = None
+        self.stats_pending = None
         self.config = configparser.ConfigParser()
+        # Without persist the config is read-only, e.g. in the isolated overlay process
+        self.config_writer = ConfigWriter(CONFIG_FILE) if persist else None
         self.load_config()
+        self.settings = CrosshairSettings.from_config(self.config)
+        self.profiles = ProfileStore()
+        self.profiles.load(self.config)
+        self.profile_var = None
         
     def parse_hex_color(self, hex_color):
         """Parse hex color to RGB values"""
@@ -24,7 +79,9 @@ class CrosshairOverlay:
     
     def load_config(self):
         """Load configuration from config.ini file"""
-        self.config.read('config.ini')
+        self.config.read(CONFIG_FILE)
+        if self.config_writer:
+            self.config_writer.mark_on_disk(self.config)
         
         # Default settings
         if not self.config.has_section('crosshair'):
@@ -62,182 +119,580 @@ class CrosshairOverlay:
             
             # General
             'opacity': '0.8',
-            'hotkey_toggle': 'F1'
+            'hotkey_toggle': 'F1',
+            'hotkey_settings': 'F2',
+            'hotkey_poll_ms': '5',
+            'max_refresh_rate': '144',
+            'active_profile': '',
+            'watch_config': 'True',
+            'watch_interval_ms': '500',
+            'shared_poll_ms': '4',
+            'render_mode': 'vector',
+            'image_cache_mb': '8',
+            'stats_log_interval_s': '60',
+            'animation_hz': '240',
+            'fade_ms': '120',
+            'hotkey_recoil': '',
+            'recoil_spread': '6',
+            'recoil_max_spread': '12',
+            'recoil_decay_ms': '120',
+            'idle_poll_ms': '100',
+            'watch_idle_interval_ms': '5000',
+            'overlay_monitors': 'primary',
+            'overlay_anchors': '',
+            'display_check_ms': '2000'
         }
         
         for key, value in defaults.items():
             if not self.config.has_option('crosshair', key):
                 self.config.set('crosshair', key, value)
+        for key in LEGACY_KEYS:
+            self.config.remove_option('crosshair', key)
                 
         self.save_config()
     
-    def save_config(self):
-        """Save configuration to config.ini file"""
-        with open('config.ini', 'w') as configfile:
-            self.config.write(configfile)
+    def set_option(self, key, value):
+        """Set a config value, refreshing the settings snapshot only on a real change"""
+        value = str(value)
+        if self.config.get(SECTION, key, fallback=None) == value:
+            return False
+        # Parse first, so a value that doesn't parse (ValueError) changes nothing
+        settings = self.settings.with_option(key, value)
+        self.config.set(SECTION, key, value)
+        self.settings = settings
+        return True
     
-    def create_overlay(self):
-        """Create the transparent overlay window"""
-        if self.overlay_window:
+    def apply_look(self, settings, raw, plan=None, profile=''):
+        """Make settings the live look
+        
+        raw holds the config string of every drawing key; plan skips
+        compiling when the caller already has one; profile is recorded as
+        the active profile ('' for none).
+        """
+        for key, value in raw.items():
+            self.config.set(SECTION, key, value)
+        self.config.set(SECTION, 'active_profile', profile)
+        self.settings = settings
+        self.save_config(SECTION)
+        if self.overlays:
+            self.set_alpha(settings.opacity * self.fade)
+            self.draw_crosshair(plan=plan)
+        if self.settings_publisher:
+            self.settings_publisher.publish(settings)
+        if self.settings_model:
+            self.settings_model.push(settings)
+            self.profile_var.set(profile)
+    
+    def switch_profile(self, name):
+        """Make a stored profile the live look, drawing its precompiled plan"""
+        profile = self.profiles.get(name)
+        self.apply_look(profile.settings, profile.raw, profile.plan, name)
+    
+    def share_code(self):
+        """Share code for the live look; ValueError if a value is outside the shareable ranges"""
+        return sharecode.encode(self.settings)
+    
+    def import_share_code(self, code):
+        """Make the look in a share code live; ValueError if the code is invalid"""
+        settings = sharecode.decode(code)
+        self.apply_look(settings, sharecode.config_values(settings))
+    
+    def export_to(self, variable):
+        """Show the live look's share code in variable and copy it to the clipboard"""
+        try:
+            code = self.share_code()
+        except ValueError as error:
+            messagebox.showerror("Cannot export", str(error))
             return
-            
-        self.overlay_window = tk.Toplevel()
-        self.overlay_window.title("Crosshair Overlay")
-        
-        # Make window transparent and always on top
-        opacity = float(self.config.get('crosshair', 'opacity'))
-        self.overlay_window.attributes('-alpha', opacity)
-        self.overlay_window.attributes('-topmost', True)
-        self.overlay_window.overrideredirect(True)  # Remove window decorations
-        
-        # Position window in center of screen
-        screen_width = self.overlay_window.winfo_screenwidth()
-        screen_height = self.overlay_window.winfo_screenheight()
-        window_size = 100  # Size of the overlay window
-        
-        x = (screen_width - window_size) // 2
-        y = (screen_height - window_size) // 2
-        
-        self.overlay_window.geometry(f"{window_size}x{window_size}+{x}+{y}")
-        
-        # Create canvas for drawing crosshair
-        self.canvas = tk.Canvas(
-            self.overlay_window,
-            width=window_size,
-            height=window_size,
-            bg='black',
-            highlightthickness=0
+        variable.set(code)
+        self.root.clipboard_clear()
+        self.root.clipboard_append(code)
+    
+    def import_from(self, variable):
+        """Apply the share code typed into variable"""
+        try:
+            self.import_share_code(variable.get())
+        except ValueError as error:
+            messagebox.showerror("Invalid share code", str(error))
+    
+    def save_profile(self, name):
+        """Store the live look as a named profile"""
+        name = name.strip()
+        if not name:
+            return
+        self.profiles.save(self.config, name)
+        self.config.set(SECTION, 'active_profile', name)
+        self.save_config()
+        if self.profile_var:
+            self.profile_combobox.configure(values=self.profiles.names())
+            self.profile_var.set(name)
+    
+    def reload_config(self):
+        """Apply external edits to config.ini, touching only the keys that changed
+        
+        The file is compared with what was last read or written, not with the
+        live config, so local changes still waiting to be saved are kept and
+        written on top of the external edit.
+        """
+        fresh = configparser.ConfigParser()
+        try:
+            fresh.read(CONFIG_FILE)
+        except configparser.Error as error:
+            # Probably caught mid-edit; the next change will trigger another reload
+            logger.warning("Ignoring unreadable %s: %s", CONFIG_FILE, error)
+            return
+        if not fresh.has_section(SECTION):
+            return
+        on_disk = self.config_writer.on_disk if self.config_writer else None
+        if on_disk is None:
+            # Nothing known about the file; treat every difference as external
+            on_disk = {section: dict(self.config.items(section, raw=True)) for section in self.config.sections()}
+        
+        layers = set()
+        before = on_disk.get(SECTION, {})
+        for key, value in fresh.items(SECTION, raw=True):
+            if before.get(key) == value:
+                continue
+            if self.config.get(SECTION, key, raw=True, fallback=None) != value:
+                try:
+                    self.set_option(key, value)
+                except ValueError:
+                    # Probably saved mid-edit; keep the old value until it parses
+                    logger.warning("Ignoring invalid %s = %r in %s", key, value, CONFIG_FILE)
+                    continue
+                layers.add(KEY_LAYERS.get(key))
+        
+        profile_sections = set(section for section in fresh.sections() if section.startswith(PROFILE_PREFIX))
+        profile_sections.update(section for section in on_disk if section.startswith(PROFILE_PREFIX))
+        changed_sections = [section for section in profile_sections
+                            if (dict(fresh.items(section, raw=True)) if fresh.has_section(section) else None)
+                            != on_disk.get(section)]
+        for section in changed_sections:
+            self.config.remove_section(section)
+            if fresh.has_section(section):
+                self.config.add_section(section)
+                for key, value in fresh.items(section, raw=True):
+                    self.config.set(section, key, value)
+        if changed_sections:
+            self.profiles.load(self.config)
+            if self.settings_model:
+                self.profile_combobox.configure(values=self.profiles.names())
+        
+        # Refresh the writer's copies; a save still pending is rewritten on top of the edit
+        if self.config_writer:
+            self.config_writer.mark_on_disk(fresh)
+            self.config_writer.refresh(self.config, [SECTION] + changed_sections)
+        layers.discard(None)
+        if layers:
+            self.request_redraw(*layers)
+            if self.settings_model:
+                self.settings_model.push(self.settings)
+    
+    def start_config_watcher(self, widget):
+        """Hot-reload config.ini when another program changes it"""
+        if self.config_watcher or not self.config_writer or not self.config.getboolean('crosshair', 'watch_config'):
+            return
+        self.config_watcher = ConfigWatcher(
+            widget,
+            CONFIG_FILE,
+            self.reload_config,
+            interval_ms=self.config.getint('crosshair', 'watch_interval_ms'),
+            is_own=self.config_writer.owns,
+            idle_interval_ms=self.config.getint('crosshair', 'watch_idle_interval_ms')
         )
-        self.canvas.pack()
+        self.config_watcher.start()
+    
+    def enable_instrumentation(self, stats_json=None):
+        """Time redraws, saves and toggles, and count trace callbacks per user action
         
-        # Make canvas transparent
-        self.overlay_window.attributes('-transparentcolor', 'black')
+        Only called for --stats; otherwise the plain methods run untouched.
+        stats_json is where quit_app() dumps the collected data.
+        """
+        if self.instrumentation:
+            return
+        self.instrumentation = Instrumentation()
+        self.stats_json = stats_json
+        self.instrumentation.wrap(self, 'draw_crosshair', 'redraw')
+        # save_config only queues a copy; the disk write happens on the writer thread
+        self.instrumentation.wrap(self, 'save_config', 'save_queue')
+        if self.config_writer:
+            self.instrumentation.wrap(self.config_writer, '_write_file', 'config_write')
+        self.instrumentation.wrap(self, 'toggle_visibility')
+        interval = float(self.config.get('crosshair', 'stats_log_interval_s'))
+        if interval > 0:
+            self.create_root()
+            self.instrumentation.start_logging(self.root, int(interval * 1000))
+    
+    def component_stats(self):
+        """Counters kept by the scheduler, settings model, watcher, hotkeys and caches"""
+        stats = {}
+        if self.redraw_scheduler:
+            stats['redraw_scheduler'] = {
+                'requests': self.redraw_scheduler.requests,
+                'renders': self.redraw_scheduler.renders,
+                'collapsed': self.redraw_scheduler.collapsed,
+            }
+        if self.animator:
+            stats['animation'] = self.animator.stats()
+        if self.settings_model:
+            stats['settings_model'] = self.settings_model.stats()
+        if self.config_writer:
+            stats['config_writer'] = {'writes': self.config_writer.writes,
+                                      'coalesced': self.config_writer.coalesced}
+        if self.config_watcher:
+            stats['config_watcher'] = {'reloads': self.config_watcher.reloads,
+                                       'ignored': self.config_watcher.ignored}
+        if self.hotkey_bridge:
+            stats['hotkey_latency_ms'] = {
+                kind: {'count': latency.count, 'p95': latency.percentile(0.95) * 1000,
+                       'max': latency.max * 1000}
+                for kind, latency in self.hotkey_bridge.latency.items()
+            }
+        if self.image_cache:
+            stats['image_cache'] = self.image_cache.stats()
+        if self.overlays and hasattr(self.overlays[0].renderer, 'round_trips'):
+            stats['tcl_round_trips'] = sum(overlay.renderer.round_trips for overlay in self.overlays)
+        if self.display_watcher:
+            stats['display_changes'] = self.display_watcher.changes
+        return stats
+    
+    def save_config(self, *sections):
+        """Queue a write-behind save of config.ini
         
-        self.draw_crosshair()
+        Pass the sections that changed to skip re-copying the others.
+        """
+        if self.config_writer:
+            self.config_writer.schedule(self.config, sections or None)
     
-    def draw_crosshair(self):
-        """Draw the advanced crosshair on the canvas"""
-        if not self.overlay_window:
+    def create_root(self):
+        """Create the Tk root, which hosts the settings UI and stays hidden until it is shown"""
+        if self.root:
+            return
+        
+        self.root = tk.Tk()
+        self.root.withdraw()
+        self.root.title("Advanced Crosshair Settings")
+        self.root.protocol("WM_DELETE_WINDOW", self.close_settings)
+    
+    def create_overlay(self):
+        """Create the transparent overlay windows, one per selected monitor or anchor"""
+        if self.overlays:
             return
             
-        self.canvas.delete("all")
+        self.create_root()
+        self.monitors = enumerate_monitors(self.root)
+        for anchor in self.overlay_anchors():
+            self.add_overlay(anchor)
+        self.redraw_scheduler = RedrawScheduler(
+            self.root,
+            self.apply_redraw,
+            max_fps=self.config.getint('crosshair', 'max_refresh_rate')
+        )
+        # Recoil only needs headroom in the window when a recoil hotkey is bound
+        recoil = bool(self.config.get('crosshair', 'hotkey_recoil').strip())
+        self.animator = Animator(
+            self.root,
+            self.apply_animation,
+            hz=self.config.getint('crosshair', 'animation_hz'),
+            decay_ms=self.config.getint('crosshair', 'recoil_decay_ms'),
+            fade_ms=self.config.getint('crosshair', 'fade_ms'),
+            max_spread=self.config.getint('crosshair', 'recoil_max_spread') if recoil else 0
+        )
+        if DisplayWatcher.supported():
+            self.display_watcher = DisplayWatcher(
+                self.root,
+                self.on_display_change,
+                interval_ms=self.config.getint('crosshair', 'display_check_ms')
+            )
+            self.display_watcher.set_idle(self.idle)
+            self.display_watcher.start()
         
-        center_x = 50  # Center of 100x100 window
-        center_y = 50
+        self.draw_crosshair()
+    
+    def overlay_anchors(self):
+        """Screen points selected by overlay_monitors and overlay_anchors"""
+        return overlay_anchors(
+            self.monitors,
+            self.config.get('crosshair', 'overlay_monitors'),
+            self.config.get('crosshair', 'overlay_anchors')
+        )
+    
+    def add_overlay(self, anchor, hidden=False):
+        overlay = Overlay(self.root, anchor, self.settings.opacity * self.fade, self.create_renderer)
+        if hidden:
+            overlay.window.withdraw()
+        self.overlays.append(overlay)
+        return overlay
+    
+    def on_display_change(self, monitors):
+        """Move, add or remove overlays after monitors were plugged, unplugged or rearranged"""
+        self.monitors = monitors
+        anchors = self.overlay_anchors()
+        logger.info("Display layout changed: %d monitor(s), %d overlay(s)", len(monitors), len(anchors))
+        while len(self.overlays) > len(anchors):
+            self.overlays.pop().destroy()
+        for overlay, anchor in zip(self.overlays, anchors):
+            overlay.anchor = anchor
+        for anchor in anchors[len(self.overlays):]:
+            self.add_overlay(anchor, hidden=not self.is_visible)
+        # Forces update_geometry to re-place every window and redraw all layers
+        self.window_size = None
+        self.draw_crosshair()
+    
+    def create_renderer(self, canvas):
+        """Create the canvas backend selected by render_mode (vector, batched or image)"""
+        mode = self.config.get('crosshair', 'render_mode')
+        if mode == 'batched':
+            return BatchedCanvasRenderer(canvas)
+        if mode == 'image':
+            # Imported lazily: the image backend pulls in numpy, which is slow to import
+            from imagecache import ImageCache, ImageRenderer
+            if ImageRenderer.available():
+                # One cache for all overlays, so each look is rasterized once
+                if self.image_cache is None:
+                    max_bytes = int(float(self.config.get('crosshair', 'image_cache_mb')) * 1024 * 1024)
+                    self.image_cache = ImageCache(max_bytes)
+                return ImageRenderer(canvas, self.image_cache)
+            logger.warning("render_mode = image needs numpy; falling back to vector drawing")
+        return CanvasRenderer(canvas)
+    
+    def update_geometry(self, plan):
+        """Shrink-wrap the overlays around the plan, keeping each centered on its anchor"""
+        window_size = overlay_size(plan)
+        if window_size == self.window_size:
+            return False
+        self.window_size = window_size
+        for overlay in self.overlays:
+            overlay.place(window_size)
+        return True
+    
+    def draw_crosshair(self, layers=None, plan=None):
+        """Draw the advanced crosshair on every overlay
         
-        # Draw outer lines first (so they appear behind inner lines)
-        if self.config.getboolean('crosshair', 'outer_enabled'):
-            outer_length = int(self.config.get('crosshair', 'outer_length'))
-            outer_thickness = int(self.config.get('crosshair', 'outer_thickness'))
-            outer_offset = int(self.config.get('crosshair', 'outer_offset'))
-            outer_color = self.config.get('crosshair', 'outer_color')
-            
-            # Outer line positions (start from offset distance from center)
-            outer_start = outer_offset
-            outer_end = outer_offset + outer_length
-            
-            # Draw outer outlines first if enabled
-            if self.config.getboolean('crosshair', 'outer_outline_enabled'):
-                outline_thickness = int(self.config.get('crosshair', 'outer_outline_thickness'))
-                outline_color = self.config.get('crosshair', 'outer_outline_color')
-                total_thickness = outer_thickness + (outline_thickness * 2)
-                
-                # Horizontal outer outlines
-                self.canvas.create_line(center_x + outer_start, center_y, center_x + outer_end, center_y, fill=outline_color, width=total_thickness)
-                self.canvas.create_line(center_x - outer_start, center_y, center_x - outer_end, center_y, fill=outline_color, width=total_thickness)
-                # Vertical outer outlines
-                self.canvas.create_line(center_x, center_y + outer_start, center_x, center_y + outer_end, fill=outline_color, width=total_thickness)
-                self.canvas.create_line(center_x, center_y - outer_start, center_x, center_y - outer_end, fill=outline_color, width=total_thickness)
-            
-            # Draw outer lines
-            # Horizontal outer lines
-            self.canvas.create_line(center_x + outer_start, center_y, center_x + outer_end, center_y, fill=outer_color, width=outer_thickness)
-            self.canvas.create_line(center_x - outer_start, center_y, center_x - outer_end, center_y, fill=outer_color, width=outer_thickness)
-            # Vertical outer lines
-            self.canvas.create_line(center_x, center_y + outer_start, center_x, center_y + outer_end, fill=outer_color, width=outer_thickness)
-            self.canvas.create_line(center_x, center_y - outer_start, center_x, center_y - outer_end, fill=outer_color, width=outer_thickness)
-        
-        # Draw inner lines
-        if self.config.getboolean('crosshair', 'inner_enabled'):
-            inner_length = int(self.config.get('crosshair', 'inner_length'))
-            inner_thickness = int(self.config.get('crosshair', 'inner_thickness'))
-            inner_offset = int(self.config.get('crosshair', 'inner_offset'))
-            inner_color = self.config.get('crosshair', 'inner_color')
-            
-            # Inner line positions (start from offset distance from center)
-            inner_start = inner_offset
-            inner_end = inner_offset + inner_length
-            
-            # Draw inner outlines first if enabled
-            if self.config.getboolean('crosshair', 'inner_outline_enabled'):
-                outline_thickness = int(self.config.get('crosshair', 'inner_outline_thickness'))
-                outline_color = self.config.get('crosshair', 'inner_outline_color')
-                total_thickness = inner_thickness + (outline_thickness * 2)
-                
-                # Horizontal inner outlines
-                self.canvas.create_line(center_x + inner_start, center_y, center_x + inner_end, center_y, fill=outline_color, width=total_thickness)
-                self.canvas.create_line(center_x - inner_start, center_y, center_x - inner_end, center_y, fill=outline_color, width=total_thickness)
-                # Vertical inner outlines
-                self.canvas.create_line(center_x, center_y + inner_start, center_x, center_y + inner_end, fill=outline_color, width=total_thickness)
-                self.canvas.create_line(center_x, center_y - inner_start, center_x, center_y - inner_end, fill=outline_color, width=total_thickness)
-            
-            # Draw inner lines
-            # Horizontal inner lines
-            self.canvas.create_line(center_x + inner_start, center_y, center_x + inner_end, center_y, fill=inner_color, width=inner_thickness)
-            self.canvas.create_line(center_x - inner_start, center_y, center_x - inner_end, center_y, fill=inner_color, width=inner_thickness)
-            # Vertical inner lines
-            self.canvas.create_line(center_x, center_y + inner_start, center_x, center_y + inner_end, fill=inner_color, width=inner_thickness)
-            self.canvas.create_line(center_x, center_y - inner_start, center_x, center_y - inner_end, fill=inner_color, width=inner_thickness)
-        
-        # Draw center dot last (so it appears on top)
-        if self.config.getboolean('crosshair', 'center_dot_enabled'):
-            dot_size = int(self.config.get('crosshair', 'center_dot_size'))
-            dot_color = self.config.get('crosshair', 'center_dot_color')
-            
-            # Draw center dot outline first if enabled
-            if self.config.getboolean('crosshair', 'center_dot_outline_enabled'):
-                outline_thickness = int(self.config.get('crosshair', 'center_dot_outline_thickness'))
-                outline_color = self.config.get('crosshair', 'center_dot_outline_color')
-                total_size = dot_size + outline_thickness
-                
-                self.canvas.create_oval(
-                    center_x - total_size, center_y - total_size,
-                    center_x + total_size, center_y + total_size,
-                    fill=outline_color, outline=outline_color
-                )
+        layers limits the update to the given render layers; None means all.
+        plan skips compiling when the caller already has one for self.settings.
+        """
+        if not self.overlays:
+            return
             
-            # Draw center dot
-            self.canvas.create_oval(
-                center_x - dot_size, center_y - dot_size,
-                center_x + dot_size, center_y + dot_size,
-                fill=dot_color, outline=dot_color
-            )
+        if plan is None:
+            plan = compile_plan(self.settings)
+        # Size the windows for the widest recoil so animating never resizes them
+        if self.update_geometry(spread_plan(plan, self.animator.max_spread)):
+            # The center moved, so every layer needs new coordinates
+            layers = None
+        plan = spread_plan(plan, self.spread)
+        for overlay in self.overlays:
+            overlay.render(plan, layers)
+    
+    def set_alpha(self, alpha):
+        for overlay in self.overlays:
+            overlay.window.attributes('-alpha', alpha)
+    
+    def apply_animation(self, spread, fade):
+        """Show one animation frame, moving the arms only when the spread crosses a whole pixel"""
+        spread = round(spread)
+        if spread != self.spread:
+            self.spread = spread
+            self.draw_crosshair({'inner', 'outer'})
+        if fade != self.fade:
+            self.fade = fade
+            self.set_alpha(self.settings.opacity * fade)
+            if fade == 0 and not self.is_visible:
+                for overlay in self.overlays:
+                    overlay.window.withdraw()
+    
+    def recoil(self):
+        """Spread the arms outwards; they settle back on their own"""
+        if self.animator:
+            self.animator.kick(self.config.getint('crosshair', 'recoil_spread'))
+    
+    def request_redraw(self, *flags):
+        """Queue overlay work ('alpha' or a render layer) for the next frame"""
+        if self.redraw_scheduler:
+            self.redraw_scheduler.request(*flags)
+        if self.settings_publisher:
+            self.settings_publisher.publish(self.settings)
+    
+    def apply_redraw(self, flags):
+        """Apply all work collected by the redraw scheduler in one pass"""
+        if not self.overlays:
+            return
+        if 'alpha' in flags:
+            self.set_alpha(self.settings.opacity * self.fade)
+        if 'crosshair' in flags:
+            self.draw_crosshair()
+        elif not flags.isdisjoint(LAYERS):
+            self.draw_crosshair(flags.intersection(LAYERS))
     
     def toggle_visibility(self):
         """Toggle crosshair visibility"""
-        if not self.overlay_window:
+        if self.settings_publisher:
+            # The overlay lives in another process; ask it to toggle
+            self.settings_publisher.publish(toggle=True)
+            self.is_visible = not self.is_visible
+            return
+        
+        if not self.overlays:
             self.create_overlay()
         
         self.is_visible = not self.is_visible
         
         if self.is_visible:
-            self.overlay_window.deiconify()
-            self.overlay_window.lift()
+            if self.display_watcher:
+                # Not polled while idle, so catch up on monitor changes before showing
+                self.display_watcher.check()
+            for overlay in self.overlays:
+                overlay.window.deiconify()
+                overlay.window.lift()
+            self.animator.fade_to(1.0)
+        elif self.animator.fade_ms > 0:
+            # apply_animation withdraws the windows once they have faded out
+            self.animator.fade_to(0.0)
         else:
-            self.overlay_window.withdraw()
+            for overlay in self.overlays:
+                overlay.window.withdraw()
     
-    def show_settings(self):
-        """Show settings window"""
-        if self.root:
+    def start_hotkeys(self, widget, source=None, kinds=('toggle', 'settings', 'preset', 'recoil')):
+        """Listen for global hotkeys and feed them into the Tk loop via widget.after
+        
+        kinds limits which hotkey events are bound.
+        """
+        if self.hotkey_bridge:
             return
-            
-        self.root = tk.Tk()
-        self.root.title("Advanced Crosshair Settings")
-        self.root.geometry("600x800")
+        source = source or default_key_source()
+        if source is None:
+            logger.info("Global hotkeys are not supported on this platform")
+            return
+        bindings = {
+            self.config.get('crosshair', 'hotkey_toggle'): ('toggle', None),
+            self.config.get('crosshair', 'hotkey_settings'): ('settings', None),
+            self.config.get('crosshair', 'hotkey_recoil'): ('recoil', None),
+        }
+        for name in self.profiles.names():
+            hotkey = self.profiles.get(name).hotkey
+            if hotkey:
+                bindings[hotkey] = ('preset', name)
+        handlers = {
+            'toggle': lambda event: self.toggle_visibility(),
+            'settings': lambda event: self.show_settings(),
+            'preset': lambda event: self.switch_profile(event.payload),
+            'recoil': lambda event: self.recoil(),
+        }
+        bindings = {hotkey: event for hotkey, event in bindings.items() if hotkey.strip() and event[0] in kinds}
+        self.hotkey_bridge = HotkeyBridge(
+            widget,
+            HotkeyListener(source, bindings),
+            handlers,
+            interval_ms=self.config.getint('crosshair', 'hotkey_poll_ms'),
+            idle_interval_ms=self.config.getint('crosshair', 'idle_poll_ms')
+        )
+        self.hotkey_bridge.start()
+    
+    def set_idle(self, idle):
+        """Enter or leave idle mode, in which no timer fires unless something happens
+        
+        Idle means the settings window is closed. The hotkey pump stops and
+        the listener wakes the loop per key press, the config watcher polls
+        rarely (or not at all where Tk can watch its descriptor) and the
+        display watcher stops until the overlay is shown or settings open.
+        Animations and redraws already run only while there is work to do.
+        """
+        if idle == self.idle:
+            return
+        self.idle = idle
+        if self.hotkey_bridge:
+            self.hotkey_bridge.set_idle(idle)
+        if self.config_watcher:
+            self.config_watcher.set_idle(idle)
+        if self.display_watcher:
+            self.display_watcher.set_idle(idle)
+    
+    def run(self, overlay_only=False):
+        """Show the crosshair and run the Tk main loop
+        
+        With overlay_only the settings window is not built at startup; it is
+        created on first use from the settings hotkey.
+        """
+        self.create_root()
         
         # Create and show crosshair by default
         self.create_overlay()
         self.is_visible = True
+        self.start_hotkeys(self.root)
+        self.start_config_watcher(self.root)
+        
+        if overlay_only:
+            self.quit_on_settings_close = False
+            self.set_idle(True)
+        else:
+            self.show_settings()
+        self.root.mainloop()
+    
+    def run_isolated(self):
+        """Run the settings UI in this process and the overlay in its own minimal process
+        
+        Settings reach the overlay through a shared memory record, so work in
+        the settings window never delays the overlay's event loop. The
+        overlay process handles the toggle and recoil hotkeys; the settings
+        and profile hotkeys are handled here, where the window and profiles live.
+        """
+        self.create_root()
+        self.settings_publisher = SharedSettingsWriter()
+        self.settings_publisher.publish(self.settings)
+        self.overlay_process = multiprocessing.Process(
+            target=run_overlay_process,
+            args=(self.settings_publisher.name, self.instrumentation is not None, self.stats_json),
+            name="crosshair-overlay",
+            daemon=True
+        )
+        self.overlay_process.start()
+        self.is_visible = True
+        self.start_hotkeys(self.root, kinds=('settings', 'preset'))
+        self.start_config_watcher(self.root)
+        self.show_settings()
+        self.root.mainloop()
+    
+    def poll_shared_settings(self):
+        """Pick up records published by the settings process (overlay process side)"""
+        parent = multiprocessing.parent_process()
+        if parent is not None and not parent.is_alive():
+            # The settings process died without asking us to quit
+            self.quit_app()
+            return
+        record = self.settings_reader.poll()
+        if record:
+            self.shared_changed_at = time.perf_counter()
+            settings, toggles, quit = record
+            if quit:
+                self.quit_app()
+                return
+            if toggles != self.remote_toggles:
+                self.remote_toggles = toggles
+                self.toggle_visibility()
+            layers = changed_layers(self.settings, settings)
+            if layers:
+                self.settings = settings
+                self.request_redraw(*layers)
+        # Poll fast while settings are being changed, and back off after a quiet second
+        if time.perf_counter() - self.shared_changed_at < 1.0:
+            interval = self.config.getint('crosshair', 'shared_poll_ms')
+        else:
+            interval = self.config.getint('crosshair', 'idle_poll_ms')
+        self.root.after(interval, self.poll_shared_settings)
+    
+    def show_settings(self):
+        """Show settings window, building it on first use"""
+        self.create_root()
+        self.root.deiconify()
+        self.root.lift()
+        self.set_idle(False)
+        if self.settings_built:
+            if self.stats_var and self.stats_pending is None:
+                self.update_stats_panel()
+            return
+        self.settings_built = True
+        self.root.geometry("600x800")
         
         # Create scrollable frame
         canvas = tk.Canvas(self.root)
@@ -258,218 +713,61 @@ class CrosshairOverlay:
         frame = ttk.Frame(scrollable_frame, padding="10")
         frame.pack(fill="both", expand=True)
         
-        # Initialize all variables
+        # Variables are added as their sections get built
         self.vars = {}
         
-        # Define update function
-        def update_settings(*args):
-            # Update all config values from variables
-            for key, var in self.vars.items():
-                if isinstance(var, tk.BooleanVar):
-                    self.config.set('crosshair', key, str(var.get()))
-                elif key.endswith('_color'):
-                    # Handle RGB color variables
-                    if key.endswith('_color'):
-                        base_key = key[:-6]  # Remove '_color'
-                        if f"{base_key}_red" in self.vars:
-                            r = self.vars[f"{base_key}_red"].get()
-                            g = self.vars[f"{base_key}_green"].get()
-                            b = self.vars[f"{base_key}_blue"].get()
-                            self.config.set('crosshair', key, f"#{r:02x}{g:02x}{b:02x}")
-                else:
-                    self.config.set('crosshair', key, str(var.get()))
-            
-            self.save_config()
-            if self.overlay_window:
-                self.overlay_window.attributes('-alpha', float(self.config.get('crosshair', 'opacity')))
-                self.draw_crosshair()
+        # Each variable is bound to exactly one config key
+        self.settings_model = SettingsModel(self.on_setting_changed, self.request_redraw)
         
         row = 0
         
-        # Inner Lines Section
-        ttk.Label(frame, text="INNER LINES", font=("Arial", 12, "bold")).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=(10, 5))
-        row += 1
-        
-        # Inner enabled
-        self.vars['inner_enabled'] = tk.BooleanVar(value=self.config.getboolean('crosshair', 'inner_enabled'))
-        ttk.Checkbutton(frame, text="Enable Inner Lines", variable=self.vars['inner_enabled']).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=2)
-        self.vars['inner_enabled'].trace_add('write', update_settings)
-        row += 1
-        
-        # Inner length
-        ttk.Label(frame, text="Length:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        self.vars['inner_length'] = tk.IntVar(value=int(self.config.get('crosshair', 'inner_length')))
-        inner_length_scale = ttk.Scale(frame, from_=1, to=50, variable=self.vars['inner_length'], orient=tk.HORIZONTAL, length=200)
-        inner_length_scale.configure(command=lambda val: self.vars['inner_length'].set(int(float(val))))
-        inner_length_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['inner_length'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['inner_length'].trace_add('write', update_settings)
+        # Profiles Section
+        ttk.Label(frame, text="PROFILES", font=("Arial", 12, "bold")).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=(10, 5))
         row += 1
         
-        # Inner thickness
-        ttk.Label(frame, text="Thickness:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        self.vars['inner_thickness'] = tk.IntVar(value=int(self.config.get('crosshair', 'inner_thickness')))
-        inner_thickness_scale = ttk.Scale(frame, from_=1, to=10, variable=self.vars['inner_thickness'], orient=tk.HORIZONTAL, length=200)
-        inner_thickness_scale.configure(command=lambda val: self.vars['inner_thickness'].set(int(float(val))))
-        inner_thickness_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['inner_thickness'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['inner_thickness'].trace_add('write', update_settings)
+        ttk.Label(frame, text="Profile:").grid(row=row, column=0, sticky=tk.W, pady=2)
+        self.profile_var = tk.StringVar(value=self.config.get('crosshair', 'active_profile'))
+        self.profile_combobox = ttk.Combobox(frame, textvariable=self.profile_var, values=self.profiles.names(), state="readonly", width=25)
+        self.profile_combobox.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
+        self.profile_combobox.bind("<<ComboboxSelected>>", lambda e: self.switch_profile(self.profile_var.get()))
         row += 1
         
-        # Inner offset
-        ttk.Label(frame, text="Offset:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        self.vars['inner_offset'] = tk.IntVar(value=int(self.config.get('crosshair', 'inner_offset')))
-        inner_offset_scale = ttk.Scale(frame, from_=0, to=20, variable=self.vars['inner_offset'], orient=tk.HORIZONTAL, length=200)
-        inner_offset_scale.configure(command=lambda val: self.vars['inner_offset'].set(int(float(val))))
-        inner_offset_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['inner_offset'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['inner_offset'].trace_add('write', update_settings)
+        new_profile_var = tk.StringVar()
+        ttk.Label(frame, text="Save as:").grid(row=row, column=0, sticky=tk.W, pady=2)
+        ttk.Entry(frame, textvariable=new_profile_var, width=28).grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
+        ttk.Button(frame, text="Save", command=lambda: self.save_profile(new_profile_var.get())).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
         row += 1
         
-        # Inner color RGB
-        r, g, b = self.parse_hex_color(self.config.get('crosshair', 'inner_color'))
-        self.vars['inner_red'] = tk.IntVar(value=r)
-        self.vars['inner_green'] = tk.IntVar(value=g)
-        self.vars['inner_blue'] = tk.IntVar(value=b)
-        
-        ttk.Label(frame, text="Red:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        inner_red_scale = ttk.Scale(frame, from_=0, to=255, variable=self.vars['inner_red'], orient=tk.HORIZONTAL, length=200)
-        inner_red_scale.configure(command=lambda val: self.vars['inner_red'].set(int(float(val))))
-        inner_red_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['inner_red'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['inner_red'].trace_add('write', lambda *args: self.update_color_and_settings('inner_color', update_settings))
+        # Share Section
+        ttk.Label(frame, text="SHARE", font=("Arial", 12, "bold")).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=(15, 5))
         row += 1
         
-        ttk.Label(frame, text="Green:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        inner_green_scale = ttk.Scale(frame, from_=0, to=255, variable=self.vars['inner_green'], orient=tk.HORIZONTAL, length=200)
-        inner_green_scale.configure(command=lambda val: self.vars['inner_green'].set(int(float(val))))
-        inner_green_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['inner_green'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['inner_green'].trace_add('write', lambda *args: self.update_color_and_settings('inner_color', update_settings))
+        share_var = tk.StringVar()
+        ttk.Label(frame, text="Code:").grid(row=row, column=0, sticky=tk.W, pady=2)
+        ttk.Entry(frame, textvariable=share_var, width=28).grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
+        share_buttons = ttk.Frame(frame)
+        share_buttons.grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
+        ttk.Button(share_buttons, text="Export", command=lambda: self.export_to(share_var)).pack(side=tk.LEFT)
+        ttk.Button(share_buttons, text="Import", command=lambda: self.import_from(share_var)).pack(side=tk.LEFT, padx=(5, 0))
         row += 1
         
-        ttk.Label(frame, text="Blue:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        inner_blue_scale = ttk.Scale(frame, from_=0, to=255, variable=self.vars['inner_blue'], orient=tk.HORIZONTAL, length=200)
-        inner_blue_scale.configure(command=lambda val: self.vars['inner_blue'].set(int(float(val))))
-        inner_blue_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['inner_blue'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['inner_blue'].trace_add('write', lambda *args: self.update_color_and_settings('inner_color', update_settings))
-        row += 1
-        
-        # Inner outline
-        self.vars['inner_outline_enabled'] = tk.BooleanVar(value=self.config.getboolean('crosshair', 'inner_outline_enabled'))
-        ttk.Checkbutton(frame, text="Enable Outline", variable=self.vars['inner_outline_enabled']).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=2)
-        self.vars['inner_outline_enabled'].trace_add('write', update_settings)
-        row += 1
-        
-        # Outer Lines Section
-        ttk.Label(frame, text="OUTER LINES", font=("Arial", 12, "bold")).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=(15, 5))
-        row += 1
+        # Setting sections start collapsed; each is built the first time it is expanded
+        self.sections = {}
+        self.built_sections = set()
+        for section in SECTIONS:
+            row = self.add_section(frame, row, section)
         
-        # Outer enabled
-        self.vars['outer_enabled'] = tk.BooleanVar(value=self.config.getboolean('crosshair', 'outer_enabled'))
-        ttk.Checkbutton(frame, text="Enable Outer Lines", variable=self.vars['outer_enabled']).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=2)
-        self.vars['outer_enabled'].trace_add('write', update_settings)
-        row += 1
-        
-        # Outer length
-        ttk.Label(frame, text="Length:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        self.vars['outer_length'] = tk.IntVar(value=int(self.config.get('crosshair', 'outer_length')))
-        outer_length_scale = ttk.Scale(frame, from_=1, to=50, variable=self.vars['outer_length'], orient=tk.HORIZONTAL, length=200)
-        outer_length_scale.configure(command=lambda val: self.vars['outer_length'].set(int(float(val))))
-        outer_length_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['outer_length'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['outer_length'].trace_add('write', update_settings)
-        row += 1
-        
-        # Outer thickness
-        ttk.Label(frame, text="Thickness:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        self.vars['outer_thickness'] = tk.IntVar(value=int(self.config.get('crosshair', 'outer_thickness')))
-        outer_thickness_scale = ttk.Scale(frame, from_=1, to=10, variable=self.vars['outer_thickness'], orient=tk.HORIZONTAL, length=200)
-        outer_thickness_scale.configure(command=lambda val: self.vars['outer_thickness'].set(int(float(val))))
-        outer_thickness_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['outer_thickness'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['outer_thickness'].trace_add('write', update_settings)
-        row += 1
-        
-        # Outer offset
-        ttk.Label(frame, text="Offset:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        self.vars['outer_offset'] = tk.IntVar(value=int(self.config.get('crosshair', 'outer_offset')))
-        outer_offset_scale = ttk.Scale(frame, from_=0, to=30, variable=self.vars['outer_offset'], orient=tk.HORIZONTAL, length=200)
-        outer_offset_scale.configure(command=lambda val: self.vars['outer_offset'].set(int(float(val))))
-        outer_offset_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['outer_offset'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['outer_offset'].trace_add('write', update_settings)
-        row += 1
-        
-        # Outer color RGB
-        r, g, b = self.parse_hex_color(self.config.get('crosshair', 'outer_color'))
-        self.vars['outer_red'] = tk.IntVar(value=r)
-        self.vars['outer_green'] = tk.IntVar(value=g)
-        self.vars['outer_blue'] = tk.IntVar(value=b)
-        
-        ttk.Label(frame, text="Red:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        outer_red_scale = ttk.Scale(frame, from_=0, to=255, variable=self.vars['outer_red'], orient=tk.HORIZONTAL, length=200)
-        outer_red_scale.configure(command=lambda val: self.vars['outer_red'].set(int(float(val))))
-        outer_red_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['outer_red'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['outer_red'].trace_add('write', lambda *args: self.update_color_and_settings('outer_color', update_settings))
-        row += 1
-        
-        ttk.Label(frame, text="Green:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        outer_green_scale = ttk.Scale(frame, from_=0, to=255, variable=self.vars['outer_green'], orient=tk.HORIZONTAL, length=200)
-        outer_green_scale.configure(command=lambda val: self.vars['outer_green'].set(int(float(val))))
-        outer_green_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['outer_green'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['outer_green'].trace_add('write', lambda *args: self.update_color_and_settings('outer_color', update_settings))
-        row += 1
-        
-        ttk.Label(frame, text="Blue:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        outer_blue_scale = ttk.Scale(frame, from_=0, to=255, variable=self.vars['outer_blue'], orient=tk.HORIZONTAL, length=200)
-        outer_blue_scale.configure(command=lambda val: self.vars['outer_blue'].set(int(float(val))))
-        outer_blue_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['outer_blue'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['outer_blue'].trace_add('write', lambda *args: self.update_color_and_settings('outer_color', update_settings))
-        row += 1
-        
-        # Center Dot Section
-        ttk.Label(frame, text="CENTER DOT", font=("Arial", 12, "bold")).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=(15, 5))
-        row += 1
-        
-        # Center dot enabled
-        self.vars['center_dot_enabled'] = tk.BooleanVar(value=self.config.getboolean('crosshair', 'center_dot_enabled'))
-        ttk.Checkbutton(frame, text="Enable Center Dot", variable=self.vars['center_dot_enabled']).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=2)
-        self.vars['center_dot_enabled'].trace_add('write', update_settings)
-        row += 1
-        
-        # Center dot size
-        ttk.Label(frame, text="Size:").grid(row=row, column=0, sticky=tk.W, pady=2)
-        self.vars['center_dot_size'] = tk.IntVar(value=int(self.config.get('crosshair', 'center_dot_size')))
-        dot_size_scale = ttk.Scale(frame, from_=1, to=10, variable=self.vars['center_dot_size'], orient=tk.HORIZONTAL, length=200)
-        dot_size_scale.configure(command=lambda val: self.vars['center_dot_size'].set(int(float(val))))
-        dot_size_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['center_dot_size'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['center_dot_size'].trace_add('write', update_settings)
-        row += 1
-        
-        # General Section
-        ttk.Label(frame, text="GENERAL", font=("Arial", 12, "bold")).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=(15, 5))
-        row += 1
-        
-        # Opacity
-        ttk.Label(frame, text="Opacity (%):").grid(row=row, column=0, sticky=tk.W, pady=2)
-        opacity_config_val = float(self.config.get('crosshair', 'opacity'))
-        opacity_percent = max(0, min(100, int(opacity_config_val * 100)))  # Clamp between 0-100
-        self.vars['opacity'] = tk.IntVar(value=opacity_percent)
-        opacity_scale = ttk.Scale(frame, from_=0, to=100, variable=self.vars['opacity'], orient=tk.HORIZONTAL, length=200)
-        opacity_scale.configure(command=lambda val: self.vars['opacity'].set(int(float(val))))
-        opacity_scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
-        ttk.Entry(frame, textvariable=self.vars['opacity'], width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
-        self.vars['opacity'].trace_add('write', lambda *args: self.update_opacity_and_settings(update_settings))
-        row += 1
-        
-        # Apply initial settings to draw crosshair
-        update_settings()
+        if self.instrumentation:
+            self.instrumentation.wrap_fanout(self.settings_model, 'changed', self.root)
+            
+            # Stats Section, only with --stats
+            ttk.Label(frame, text="STATS", font=("Arial", 12, "bold")).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=(15, 5))
+            row += 1
+            
+            self.stats_var = tk.StringVar()
+            ttk.Label(frame, textvariable=self.stats_var, justify=tk.LEFT, font=("Courier", 9)).grid(row=row, column=0, columnspan=3, sticky=tk.W)
+            row += 1
+            self.update_stats_panel()
         
         # Buttons
         button_frame = ttk.Frame(frame)
@@ -477,51 +775,222 @@ class CrosshairOverlay:
         row += 1
         
         ttk.Button(button_frame, text="Toggle Crosshair", command=self.toggle_visibility).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Quit", command=self.quit_app).pack(side=tk.LEFT, padx=5)
         ttk.Label(frame, justify=tk.LEFT).grid(row=row, column=0, columnspan=3, pady=10)
-        
-        self.root.protocol("WM_DELETE_WINDOW", self.quit_app)
-        self.root.mainloop()
     
-    def update_color_and_settings(self, color_key, update_callback):
-        """Update color from RGB values and trigger settings update"""
-        try:
-            base_key = color_key[:-6]  # Remove '_color'
-            r = self.vars[f"{base_key}_red"].get()
-            g = self.vars[f"{base_key}_green"].get()
-            b = self.vars[f"{base_key}_blue"].get()
-            self.config.set('crosshair', color_key, f"#{r:02x}{g:02x}{b:02x}")
-            self.save_config()
-            if self.overlay_window:
-                self.draw_crosshair()
-        except:
-            pass
-    
-    def update_opacity_and_settings(self, update_callback):
-        """Update opacity and trigger settings update"""
-        try:
-            opacity_val = max(0.01, self.vars['opacity'].get() / 100.0)  # Minimum 1% to keep window visible
-            self.config.set('crosshair', 'opacity', f"{opacity_val:.2f}")
-            self.save_config()
-            if self.overlay_window:
-                self.overlay_window.attributes('-alpha', opacity_val)
-                self.draw_crosshair()
-        except:
-            pass
+    def add_section(self, frame, row, section):
+        """Add a collapsible header for a schema section; returns the next free row"""
+        header = ttk.Label(frame, text=f"\u25b8 {section.title}", font=("Arial", 12, "bold"), cursor="hand2")
+        header.grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=(15, 5))
+        body = ttk.Frame(frame)
+        body.grid(row=row + 1, column=0, columnspan=3, sticky=tk.W)
+        body.grid_remove()
+        header.bind("<Button-1>", lambda e: self.toggle_section(section.name))
+        self.sections[section.name] = (section, header, body)
+        return row + 2
+    
+    def toggle_section(self, name, expand=None):
+        """Expand or collapse a section, creating its widgets on first expand"""
+        section, header, body = self.sections[name]
+        if expand is None:
+            expand = not body.winfo_manager()
+        if not expand:
+            body.grid_remove()
+            header.configure(text=f"\u25b8 {section.title}")
+            return
+        if name not in self.built_sections:
+            self.built_sections.add(name)
+            row = 0
+            for field in section.fields:
+                row = self.add_field(body, row, field)
+        body.grid()
+        header.configure(text=f"\u25be {section.title}")
+    
+    def add_field(self, parent, row, field):
+        """Create the controls for one schema field and bind them to its key"""
+        value = getattr(self.settings, field.key)
+        if field.kind == 'bool':
+            self.vars[field.key] = tk.BooleanVar(value=value)
+            ttk.Checkbutton(parent, text=field.label, variable=self.vars[field.key]).grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=2)
+            self.settings_model.bind(field.key, self.vars[field.key])
+            return row + 1
+        
+        if field.kind == 'color':
+            # One slider per channel, all three bound to the single color key
+            layer = field.key.rsplit('_', 1)[0]
+            variables = []
+            for channel, level in zip(("red", "green", "blue"), self.parse_hex_color(value)):
+                variable = self.vars[f'{layer}_{channel}'] = tk.IntVar(value=level)
+                self.add_slider(parent, row, f"{channel.title()}:", variable, field.low, field.high)
+                variables.append(variable)
+                row += 1
+            self.settings_model.bind(field.key, *variables, convert=rgb_to_hex, split=self.parse_hex_color)
+            return row
+        
+        if field.kind == 'percent':
+            variable = self.vars[field.key] = tk.IntVar(value=percent_from_opacity(value)[0])
+            self.settings_model.bind(field.key, variable, convert=opacity_from_percent, split=percent_from_opacity)
+        else:
+            variable = self.vars[field.key] = tk.IntVar(value=value)
+            self.settings_model.bind(field.key, variable)
+        self.add_slider(parent, row, field.label, variable, field.low, field.high)
+        return row + 1
+    
+    def add_slider(self, parent, row, label, variable, low, high):
+        """Label, integer slider and entry sharing one variable"""
+        ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, pady=2)
+        scale = ttk.Scale(parent, from_=low, to=high, variable=variable, orient=tk.HORIZONTAL, length=200)
+        scale.configure(command=lambda val: variable.set(int(float(val))))
+        scale.grid(row=row, column=1, sticky=tk.W, padx=(10, 0))
+        ttk.Entry(parent, textvariable=variable, width=5).grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
+    
+    def update_stats_panel(self):
+        """Refresh the stats section once a second while the settings window is shown"""
+        if self.root.state() == 'withdrawn':
+            # show_settings restarts the refresh
+            self.stats_pending = None
+            return
+        self.stats_var.set(self.instrumentation.summary().replace("; ", "\n"))
+        self.stats_pending = self.root.after(1000, self.update_stats_panel)
+    
+    def close_settings(self):
+        """Handle the settings window being closed"""
+        if self.quit_on_settings_close:
+            self.quit_app()
+        else:
+            self.root.withdraw()
+            self.set_idle(True)
+    
+    def on_setting_changed(self, key, value):
+        """Apply one key edited in the settings window; True if it really changed"""
+        if not self.set_option(key, value):
+            return False
+        self.save_config(SECTION)
+        return True
     
     def quit_app(self):
         """Quit the application"""
-        if self.overlay_window:
-            self.overlay_window.destroy()
+        if self.redraw_scheduler:
+            self.redraw_scheduler.cancel()
+            logger.info("redraw scheduler: %d requests, %d redraws, %d collapsed",
+                        self.redraw_scheduler.requests, self.redraw_scheduler.renders,
+                        self.redraw_scheduler.collapsed)
+        if self.animator:
+            self.animator.stop()
+            logger.info("animation: %(frames)d frames, %(steps)d steps, %(missed_frames)d missed, "
+                        "%(over_budget)d over budget, slowest frame %(max_tick_ms).2f ms",
+                        self.animator.stats())
+        if self.settings_model:
+            logger.info("settings changes: %(changes)d, keys written: %(keys_written)d "
+                        "(full sweep: %(sweep_keys_written)d), layers marked dirty: "
+                        "%(layers_marked)d (full sweep: %(sweep_layers_marked)d)",
+                        self.settings_model.stats())
+        if self.config_watcher:
+            self.config_watcher.stop()
+            logger.info("config watcher: %d reloads, %d own writes ignored",
+                        self.config_watcher.reloads, self.config_watcher.ignored)
+        if self.hotkey_bridge:
+            self.hotkey_bridge.stop()
+            for kind, stats in self.hotkey_bridge.latency.items():
+                logger.info("hotkey %s latency: %s", kind, stats.summary())
+        if self.image_cache:
+            logger.info("image cache: %(hits)d hits, %(misses)d misses, %(evictions)d evictions, "
+                        "%(entries)d entries, %(bytes)d bytes", self.image_cache.stats())
+        if self.display_watcher:
+            self.display_watcher.stop()
+        if self.instrumentation:
+            logger.info("stats: %s", self.instrumentation.summary())
+            if self.stats_json:
+                self.instrumentation.dump(self.stats_json, self.component_stats())
+        if self.settings_publisher:
+            self.settings_publisher.publish(quit=True)
+            self.overlay_process.join(timeout=2.0)
+            self.settings_publisher.close()
+        if self.settings_reader:
+            self.settings_reader.close()
+        if self.config_writer:
+            self.config_writer.close()
+        for overlay in self.overlays:
+            overlay.destroy()
         if self.root:
             self.root.destroy()
         sys.exit()
 
+def run_overlay_process(shared_name, stats=False, stats_json=None):
+    """Entry point of the isolated overlay process
+    
+    With stats the overlay keeps its own instrumentation; its JSON dump goes
+    next to stats_json with an .overlay suffix.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    app = CrosshairOverlay(persist=False)
+    if stats:
+        if stats_json:
+            stem, ext = os.path.splitext(stats_json)
+            stats_json = f"{stem}.overlay{ext or '.json'}"
+        app.enable_instrumentation(stats_json)
+    app.settings_reader = SharedSettingsReader(shared_name)
+    app.create_overlay()
+    app.is_visible = True
+    # Toggling and recoil are handled here so they never wait on the settings process;
+    # the settings process handles the settings and profile hotkeys
+    app.start_hotkeys(app.root, kinds=('toggle', 'recoil'))
+    app.set_idle(True)
+    app.poll_shared_settings()
+    app.root.mainloop()
+
 def main():
     """Main function"""
-    app = CrosshairOverlay()
+    parser = argparse.ArgumentParser(description="Custom crosshair overlay")
+    parser.add_argument(
+        '--overlay-only',
+        action='store_true',
+        help="start with just the crosshair; open settings later with the settings hotkey"
+    )
+    parser.add_argument(
+        '--isolated',
+        action='store_true',
+        help="run the overlay in its own process, fed by the settings window over shared memory"
+    )
+    parser.add_argument('--profile', help="switch to this saved profile on startup")
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help="time redraws, saves and toggles; log a summary periodically and show it in the settings window"
+    )
+    parser.add_argument('--import-code', metavar='CODE', help="apply a crosshair share code and save it to config.ini")
+    parser.add_argument('--export-code', action='store_true', help="print a share code for the current crosshair and exit")
+    parser.add_argument('--stats-json', metavar='PATH', help="write all collected stats to PATH as JSON on exit (implies --stats)")
+    args = parser.parse_args()
+    if args.isolated and args.overlay_only:
+        parser.error("--isolated and --overlay-only cannot be combined")
     
-    # Create settings window
-    app.show_settings()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    app = CrosshairOverlay()
+    if args.stats or args.stats_json:
+        app.enable_instrumentation(args.stats_json)
+    if args.profile:
+        if args.profile not in app.profiles:
+            parser.error(f"unknown profile {args.profile!r}; known: {', '.join(app.profiles.names()) or 'none'}")
+        app.switch_profile(args.profile)
+    if args.import_code is not None:
+        try:
+            app.import_share_code(args.import_code)
+        except ValueError as error:
+            parser.error(f"--import-code: {error}")
+    if args.export_code:
+        try:
+            print(app.share_code())
+        except ValueError as error:
+            parser.error(f"--export-code: {error}")
+        finally:
+            app.config_writer.close()
+        return
+    if args.isolated:
+        app.run_isolated()
+    else:
+        app.run(overlay_only=args.overlay_only)
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
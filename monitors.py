@@ -0,0 +1,174 @@
+"""Monitor layout discovery and change detection for placing overlays
+
+On Windows monitors are enumerated with EnumDisplayMonitors; elsewhere Tk
+only knows the size of the whole screen, which is treated as one monitor.
+DisplayWatcher polls a cheap layout signature (a few GetSystemMetrics
+calls) and only re-enumerates when it changes. It only runs on Windows,
+where the layout can be observed, and only while the app is not idle.
+"""
+import logging
+import sys
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+# Position and size in virtual screen coordinates (x, y can be negative)
+Monitor = namedtuple('Monitor', 'x y width height primary')
+
+# GetSystemMetrics indexes: primary size, virtual screen rectangle, monitor count
+_LAYOUT_METRICS = (0, 1, 76, 77, 78, 79, 80)
+
+
+def monitor_center(monitor):
+    return monitor.x + monitor.width // 2, monitor.y + monitor.height // 2
+
+
+def primary_monitor(monitors):
+    return next((monitor for monitor in monitors if monitor.primary), monitors[0])
+
+
+def _windows_monitors():
+    import ctypes
+    from ctypes import wintypes
+
+    class MONITORINFO(ctypes.Structure):
+        _fields_ = [('cbSize', wintypes.DWORD), ('rcMonitor', wintypes.RECT),
+                    ('rcWork', wintypes.RECT), ('dwFlags', wintypes.DWORD)]
+
+    MONITORINFOF_PRIMARY = 1
+    user32 = ctypes.windll.user32
+    monitors = []
+
+    def found(handle, hdc, rect, data):
+        info = MONITORINFO()
+        info.cbSize = ctypes.sizeof(MONITORINFO)
+        if user32.GetMonitorInfoW(handle, ctypes.byref(info)):
+            area = info.rcMonitor
+            monitors.append(Monitor(area.left, area.top, area.right - area.left,
+                                    area.bottom - area.top, bool(info.dwFlags & MONITORINFOF_PRIMARY)))
+        return 1
+
+    callback_type = ctypes.WINFUNCTYPE(ctypes.c_int, wintypes.HANDLE, wintypes.HDC,
+                                       ctypes.POINTER(wintypes.RECT), wintypes.LPARAM)
+    user32.EnumDisplayMonitors(None, None, callback_type(found), 0)
+    return monitors
+
+
+def enumerate_monitors(widget):
+    """Monitors sorted left to right, falling back to Tk's screen size as a single monitor"""
+    monitors = []
+    if sys.platform == 'win32':
+        try:
+            monitors = _windows_monitors()
+        except (OSError, AttributeError) as error:
+            logger.warning("Could not enumerate monitors (%s); using the primary screen", error)
+    if not monitors:
+        monitors = [Monitor(0, 0, widget.winfo_screenwidth(), widget.winfo_screenheight(), True)]
+    return sorted(monitors, key=lambda monitor: (monitor.x, monitor.y))
+
+
+def layout_signature(widget):
+    """Cheap value that changes whenever monitors are added, removed or resized"""
+    if sys.platform == 'win32':
+        import ctypes
+        metrics = ctypes.windll.user32.GetSystemMetrics
+        return tuple(metrics(index) for index in _LAYOUT_METRICS)
+    return widget.winfo_screenwidth(), widget.winfo_screenheight()
+
+
+def overlay_anchors(monitors, selection='primary', anchors=''):
+    """Screen points to center a crosshair on
+
+    selection is 'primary', 'all', 'none' or comma-separated 1-based monitor
+    numbers counted left to right; anchors adds custom points written as
+    'x,y' and separated by semicolons.
+    """
+    selection = selection.strip().lower()
+    if selection == 'all':
+        chosen = list(monitors)
+    elif selection == 'none':
+        chosen = []
+    elif selection in ('', 'primary'):
+        chosen = [primary_monitor(monitors)]
+    else:
+        chosen = []
+        for part in selection.split(','):
+            try:
+                chosen.append(monitors[int(part) - 1])
+            except (ValueError, IndexError):
+                logger.warning("Ignoring unknown monitor %r (%d connected)", part.strip(), len(monitors))
+
+    points = [monitor_center(monitor) for monitor in chosen]
+    for part in anchors.split(';'):
+        if not part.strip():
+            continue
+        try:
+            x, y = (int(value) for value in part.split(','))
+        except ValueError:
+            logger.warning("Ignoring malformed overlay anchor %r (expected x,y)", part.strip())
+            continue
+        points.append((x, y))
+    if not points:
+        # Never end up without a crosshair
+        points = [monitor_center(primary_monitor(monitors))]
+    return points
+
+
+class DisplayWatcher:
+    """Calls on_change(monitors) when the display layout changes
+
+    Polls every interval_ms while the app is active. In idle mode nothing is
+    scheduled; the owner calls check() when it wakes up for another reason,
+    e.g. before showing the overlay.
+    """
+
+    def __init__(self, widget, on_change, interval_ms=2000):
+        self.widget = widget
+        self.on_change = on_change
+        self.interval_ms = interval_ms
+        self.changes = 0
+        self.idle = False
+        self._signature = layout_signature(widget)
+        self._pending = None
+
+    @staticmethod
+    def supported():
+        """True where layout changes can be detected; elsewhere Tk's screen size never changes"""
+        return sys.platform == 'win32'
+
+    def start(self):
+        if self.interval_ms > 0 and not self.idle:
+            self._schedule()
+
+    def stop(self):
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._pending = None
+
+    def set_idle(self, idle):
+        """Stop polling while the app is idle; check once and resume when it wakes up"""
+        if idle == self.idle:
+            return
+        self.idle = idle
+        if idle:
+            self.stop()
+        elif self.interval_ms > 0:
+            self.check()
+            self._schedule()
+
+    def check(self):
+        """Look at the layout now; True if it changed and on_change was called"""
+        signature = layout_signature(self.widget)
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        self.changes += 1
+        self.on_change(enumerate_monitors(self.widget))
+        return True
+
+    def _schedule(self):
+        self._pending = self.widget.after(self.interval_ms, self._poll)
+
+    def _poll(self):
+        self.check()
+        self._schedule()
@@ -0,0 +1,46 @@
+"""Transparent crosshair windows, one per monitor or custom anchor point"""
+import tkinter as tk
+
+
+class Overlay:
+    """A topmost, undecorated window drawing the crosshair centered on a screen point"""
+
+    def __init__(self, master, anchor, opacity, make_renderer):
+        self.anchor = anchor
+        self.size = None
+        self.window = tk.Toplevel(master)
+        self.window.title("Crosshair Overlay")
+
+        # Make window transparent and always on top
+        self.window.attributes('-alpha', opacity)
+        self.window.attributes('-topmost', True)
+        self.window.overrideredirect(True)  # Remove window decorations
+
+        # Create canvas for drawing crosshair; place() sizes it to fit
+        self.canvas = tk.Canvas(
+            self.window,
+            width=1,
+            height=1,
+            bg='black',
+            highlightthickness=0
+        )
+        self.canvas.pack()
+        self.renderer = make_renderer(self.canvas)
+
+        # Make canvas transparent
+        self.window.attributes('-transparentcolor', 'black')
+
+    def place(self, size):
+        """Resize to size x size, centered on the anchor"""
+        self.size = size
+        x, y = self.anchor
+        center = size // 2
+        self.canvas.configure(width=size, height=size)
+        self.window.geometry(f"{size}x{size}+{x - center}+{y - center}")
+
+    def render(self, plan, layers=None):
+        center = self.size // 2
+        self.renderer.render(plan, center, center, layers)
+
+    def destroy(self):
+        self.window.destroy()
@@ -0,0 +1,202 @@
+import configparser
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from watcher import file_signature
+
+logger = logging.getLogger(__name__)
+
+# The process umask, read once at import: mkstemp creates files as 0600, so a
+# new config file gets the mode open() would have given it instead
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Longest wait between retries of a failed write, in seconds
+MAX_RETRY_DELAY = 30.0
+
+
+class ConfigWriter:
+    """Write-behind persistence for config.ini
+
+    Callers mark the config dirty as often as they like; a background thread
+    waits for a quiet period and then writes the latest snapshot once.
+    Every write goes to a temporary file that is renamed over the target,
+    so a crash mid-write never leaves a truncated config behind. A failed
+    write (e.g. the file is locked by another program) stays queued and is
+    retried with a growing delay.
+    """
+
+    def __init__(self, path, quiet_period=0.5):
+        self.path = path
+        self.quiet_period = quiet_period
+        self.requests = 0
+        self.writes = 0
+        self.last_signature = None
+        # Section copies as last known to be on disk (read or written); None if unknown
+        self.on_disk = None
+        self._writing = False
+        self._retry_delay = 0.0
+        self._lock = threading.Condition()
+        self._snapshot = None
+        self._sections = {}
+        self._last_request = 0.0
+        self._thread = None
+        self._closed = False
+
+    @property
+    def coalesced(self):
+        """Number of save requests that were folded into another write"""
+        return max(0, self.requests - self.writes)
+
+    def schedule(self, config, sections=None):
+        """Mark the config dirty and queue a deferred write
+
+        sections names the sections that changed since the last call; the
+        copies taken earlier are reused for the rest. None copies everything.
+        """
+        snapshot = self.refresh(config, sections)
+        with self._lock:
+            self._snapshot = snapshot
+            self._last_request = time.monotonic()
+            self.requests += 1
+            if self._closed:
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="config-writer", daemon=True)
+                self._thread.start()
+            self._lock.notify()
+
+    def refresh(self, config, sections=None):
+        """Update the cached section copies without queueing a write
+
+        Used after config was re-read from disk, so later partial saves don't
+        write stale copies of sections that were edited externally. A save
+        that is still queued, or being written right now, would put the old
+        values back over the external edit, so it is replaced by (or followed
+        by) a write of the refreshed copies.
+        """
+        # Copy the values on the caller's thread so the writer never iterates
+        # a ConfigParser that the Tk thread is still mutating. Section copies
+        # are never modified afterwards, so snapshots can share them.
+        if sections is None:
+            snapshot = {section: dict(config.items(section, raw=True))
+                        for section in config.sections()}
+        else:
+            snapshot = dict(self._sections)
+            for section in sections:
+                if config.has_section(section):
+                    snapshot[section] = dict(config.items(section, raw=True))
+                else:
+                    snapshot.pop(section, None)
+        with self._lock:
+            self._sections = snapshot
+            if self._snapshot is not None or self._writing:
+                self._snapshot = snapshot
+                self._lock.notify()
+        return snapshot
+
+    def mark_on_disk(self, config):
+        """Record config as the file's current contents, e.g. right after reading it"""
+        snapshot = {section: dict(config.items(section, raw=True))
+                    for section in config.sections()}
+        with self._lock:
+            self.on_disk = snapshot
+
+    def owns(self, signature):
+        """True if the file with this signature is one we wrote (or are writing)"""
+        with self._lock:
+            return self._writing or (signature is not None and signature == self.last_signature)
+
+    def flush(self):
+        """Write any pending snapshot immediately on the calling thread"""
+        with self._lock:
+            snapshot, self._snapshot = self._snapshot, None
+        if snapshot is not None and not self._write(snapshot):
+            self._retry(snapshot)
+
+    def close(self):
+        """Stop the background thread and perform the final flush"""
+        with self._lock:
+            self._closed = True
+            self._lock.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        self.flush()
+        if self._snapshot is not None:
+            logger.error("Unsaved config changes were lost: could not write %s", self.path)
+        logger.info("config writer: %d save requests, %d writes, %d coalesced",
+                     self.requests, self.writes, self.coalesced)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while self._snapshot is None and not self._closed:
+                    self._lock.wait()
+                if self._closed:
+                    return
+                # Keep waiting until no new request arrived for a full quiet period
+                remaining = self._last_request + self.quiet_period - time.monotonic()
+                if remaining > 0:
+                    self._lock.wait(remaining)
+                    continue
+                snapshot, self._snapshot = self._snapshot, None
+            if not self._write(snapshot):
+                self._retry(snapshot)
+
+    def _retry(self, snapshot):
+        """Queue a snapshot whose write failed again, unless a newer one is already queued"""
+        with self._lock:
+            self._retry_delay = min(max(self._retry_delay * 2, self.quiet_period), MAX_RETRY_DELAY)
+            if self._snapshot is None:
+                self._snapshot = snapshot
+                # _run waits for quiet_period after _last_request
+                self._last_request = time.monotonic() + self._retry_delay - self.quiet_period
+            logger.warning("Retrying the write of %s in %.1f s", self.path, self._retry_delay)
+
+    def _write(self, snapshot):
+        """Write snapshot to disk; False if it failed"""
+        with self._lock:
+            self._writing = True
+        try:
+            return self._write_file(snapshot)
+        finally:
+            with self._lock:
+                self._writing = False
+
+    def _write_file(self, snapshot):
+        config = configparser.ConfigParser(interpolation=None)
+        config.read_dict(snapshot)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".config-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as configfile:
+                config.write(configfile)
+            # Keep the existing file's permissions rather than mkstemp's 0600
+            try:
+                shutil.copymode(self.path, tmp_path)
+            except FileNotFoundError:
+                os.chmod(tmp_path, 0o666 & ~_UMASK)
+            os.replace(tmp_path, self.path)
+            signature = file_signature(self.path)
+        except OSError as error:
+            if self._retry_delay:
+                logger.warning("Still failing to write %s: %s", self.path, error)
+            else:
+                logger.exception("Failed to write %s", self.path)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return False
+        with self._lock:
+            self.writes += 1
+            self.last_signature = signature
+            self.on_disk = snapshot
+            self._retry_delay = 0.0
+        return True
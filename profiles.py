@@ -0,0 +1,69 @@
+"""Named crosshair profiles stored as [profile:<name>] sections of config.ini
+
+Every profile is parsed and compiled into a render plan once, when it is
+loaded or saved, so switching to it later is a dictionary lookup.
+"""
+from collections import namedtuple
+
+from render import compile_plan
+from settings import FIELD_PARSERS, SECTION, CrosshairSettings
+
+PROFILE_PREFIX = 'profile:'
+
+# raw maps each drawing key to its config string, ready to copy into [crosshair]
+Profile = namedtuple('Profile', 'name settings plan raw hotkey')
+
+
+def profile_section(name):
+    return f'{PROFILE_PREFIX}{name}'
+
+
+class ProfileStore:
+    """Ready-to-draw profiles keyed by name, in config file order"""
+
+    def __init__(self):
+        self.profiles = {}
+
+    def __contains__(self, name):
+        return name in self.profiles
+
+    def __len__(self):
+        return len(self.profiles)
+
+    def names(self):
+        return list(self.profiles)
+
+    def get(self, name):
+        return self.profiles[name]
+
+    def load(self, config):
+        """(Re)compile every profile section found in config"""
+        self.profiles = {}
+        for section in config.sections():
+            if section.startswith(PROFILE_PREFIX):
+                self._compile(config, section[len(PROFILE_PREFIX):])
+
+    def save(self, config, name, source=SECTION):
+        """Store the drawing keys of source (the live look by default) as profile name"""
+        section = profile_section(name)
+        if not config.has_section(section):
+            config.add_section(section)
+        for key in FIELD_PARSERS:
+            if config.has_option(source, key):
+                config.set(section, key, config.get(source, key, raw=True))
+        return self._compile(config, name)
+
+    def remove(self, config, name):
+        config.remove_section(profile_section(name))
+        self.profiles.pop(name, None)
+
+    def _compile(self, config, name):
+        section = profile_section(name)
+        settings = CrosshairSettings.from_config(config, section)
+        # Keys missing from the section fall back to the defaults the settings used
+        raw = {key: config.get(section, key, raw=True, fallback=str(getattr(settings, key)))
+               for key in FIELD_PARSERS}
+        hotkey = config.get(section, 'hotkey', fallback='').strip() or None
+        profile = Profile(name, settings, compile_plan(settings), raw, hotkey)
+        self.profiles[name] = profile
+        return profile
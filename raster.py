@@ -0,0 +1,85 @@
+"""Offscreen NumPy backend for render plans
+
+Draws the same primitives as CanvasRenderer into an RGBA array, without Tk or
+a display, so rendering can be checked and benchmarked headless. NumPy is an
+optional dependency; rasterize() raises RuntimeError when it is missing.
+"""
+from functools import lru_cache
+
+from render import overlay_size
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+@lru_cache(maxsize=256)
+def parse_color(color):
+    """Parse '#rgb' or '#rrggbb' into an (r, g, b) tuple"""
+    value = color.lstrip('#')
+    if len(value) == 3:
+        value = ''.join(c * 2 for c in value)
+    if len(value) != 6:
+        raise ValueError(f"Unsupported color: {color!r}")
+    return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
+
+
+def _span(low, high, limit):
+    """Pixel indices whose centers fall inside [low, high), clipped to the image"""
+    start = max(0, int(np.ceil(low - 0.5)))
+    stop = min(limit, int(np.ceil(high - 0.5)))
+    return start, stop
+
+
+def _fill_rect(image, x0, y0, x1, y1, rgba):
+    height, width = image.shape[:2]
+    col_start, col_stop = _span(x0, x1, width)
+    row_start, row_stop = _span(y0, y1, height)
+    if col_start < col_stop and row_start < row_stop:
+        image[row_start:row_stop, col_start:col_stop] = rgba
+
+
+def _fill_disk(image, cx, cy, radius, rgba):
+    height, width = image.shape[:2]
+    col_start, col_stop = _span(cx - radius, cx + radius, width)
+    row_start, row_stop = _span(cy - radius, cy + radius, height)
+    if col_start >= col_stop or row_start >= row_stop:
+        return
+    rows, cols = np.ogrid[row_start:row_stop, col_start:col_stop]
+    mask = (cols + 0.5 - cx) ** 2 + (rows + 0.5 - cy) ** 2 <= radius * radius
+    image[row_start:row_stop, col_start:col_stop][mask] = rgba
+
+
+def rasterize(plan, size=None, out=None):
+    """Render a plan into a size x size RGBA uint8 array centered on the crosshair
+
+    size defaults to the smallest square that holds the whole plan. Pass a
+    preallocated array as out to reuse its memory between frames.
+    """
+    if np is None:
+        raise RuntimeError("The offscreen renderer requires numpy")
+    if size is None:
+        size = overlay_size(plan)
+    if out is None:
+        out = np.zeros((size, size, 4), dtype=np.uint8)
+    else:
+        out[...] = 0
+    center = size // 2
+
+    for primitive in plan:
+        x1, y1, x2, y2 = primitive.coords
+        rgba = parse_color(primitive.fill) + (255,)
+        if primitive.kind == 'oval':
+            # Ovals in a plan are always circles around the center
+            radius = (x2 - x1) / 2
+            _fill_disk(out, center + (x1 + x2) / 2, center + (y1 + y2) / 2, radius, rgba)
+        elif y1 == y2:
+            half = primitive.width / 2
+            _fill_rect(out, center + min(x1, x2), center + y1 - half,
+                       center + max(x1, x2), center + y1 + half, rgba)
+        else:
+            half = primitive.width / 2
+            _fill_rect(out, center + x1 - half, center + min(y1, y2),
+                       center + x1 + half, center + max(y1, y2), rgba)
+    return out
@@ -0,0 +1,315 @@
+import math
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+LAYERS = ('outer', 'inner', 'dot')
+ARMS = ('right', 'left', 'down', 'up')
+PLAN_CACHE_SIZE = 64
+
+# One drawing primitive of a render plan. Coordinates are relative to the
+# crosshair center so a plan can be placed anywhere by its backend.
+Primitive = namedtuple('Primitive', 'slot layer role kind coords fill outline width')
+
+
+def _arm_coords(start, end):
+    """Line coordinates for the four arms, keyed by arm name"""
+    return {
+        'right': (start, 0, end, 0),
+        'left': (-start, 0, -end, 0),
+        'down': (0, start, 0, end),
+        'up': (0, -start, 0, -end),
+    }
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def compile_plan(settings):
+    """Turn a CrosshairSettings snapshot into an immutable tuple of primitives
+
+    The plan lists only visible primitives, back to front. Results are
+    memoized in a bounded LRU keyed by the (hashable) settings, so flipping
+    back to a previously seen configuration does no geometry work.
+    """
+    plan = []
+    for layer in ('outer', 'inner'):
+        if not getattr(settings, f'{layer}_enabled'):
+            continue
+        start = getattr(settings, f'{layer}_offset')
+        end = start + getattr(settings, f'{layer}_length')
+        thickness = getattr(settings, f'{layer}_thickness')
+        arms = _arm_coords(start, end)
+        if getattr(settings, f'{layer}_outline_enabled'):
+            outline_color = getattr(settings, f'{layer}_outline_color')
+            total_thickness = thickness + getattr(settings, f'{layer}_outline_thickness') * 2
+            for arm, coords in arms.items():
+                plan.append(Primitive(f'{layer}_outline_{arm}', layer, 'outline', 'line',
+                                      coords, outline_color, '', total_thickness))
+        color = getattr(settings, f'{layer}_color')
+        for arm, coords in arms.items():
+            plan.append(Primitive(f'{layer}_fill_{arm}', layer, 'fill', 'line',
+                                  coords, color, '', thickness))
+
+    if settings.center_dot_enabled:
+        dot_size = settings.center_dot_size
+        if settings.center_dot_outline_enabled:
+            total_size = dot_size + settings.center_dot_outline_thickness
+            outline_color = settings.center_dot_outline_color
+            plan.append(Primitive('dot_outline', 'dot', 'outline', 'oval',
+                                  (-total_size, -total_size, total_size, total_size),
+                                  outline_color, outline_color, 1))
+        dot_color = settings.center_dot_color
+        plan.append(Primitive('dot_fill', 'dot', 'fill', 'oval',
+                              (-dot_size, -dot_size, dot_size, dot_size),
+                              dot_color, dot_color, 1))
+    return tuple(plan)
+
+
+def plan_extent(plan):
+    """Largest distance in pixels the plan reaches from the center on either axis"""
+    extent = 0
+    for primitive in plan:
+        x1, y1, x2, y2 = primitive.coords
+        # Lines grow by half their width across their direction, ovals by their outline
+        pad = primitive.width / 2 if primitive.kind == 'line' else primitive.width
+        if primitive.kind == 'line' and y1 == y2:
+            reach = max(abs(x1), abs(x2), abs(y1) + pad)
+        elif primitive.kind == 'line' and x1 == x2:
+            reach = max(abs(y1), abs(y2), abs(x1) + pad)
+        else:
+            reach = max(abs(x1), abs(y1), abs(x2), abs(y2)) + pad
+        extent = max(extent, reach)
+    return math.ceil(extent)
+
+
+def overlay_size(plan):
+    """Side of the smallest square window that shows the whole plan unclipped"""
+    # One spare pixel per side absorbs rounding of odd widths around the center
+    return 2 * plan_extent(plan) + 2
+
+
+def _sign(value):
+    return (value > 0) - (value < 0)
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def spread_plan(plan, spread):
+    """Move every arm of the plan spread whole pixels further from the center
+
+    Used for animated recoil: the plan keeps the same primitives, so a
+    retained backend only has to update coordinates.
+    """
+    if not spread:
+        return plan
+    moved = []
+    for primitive in plan:
+        if primitive.kind == 'line':
+            x1, y1, x2, y2 = primitive.coords
+            # The arm's far end is never at the center, so it gives the direction
+            dx, dy = _sign(x2) * spread, _sign(y2) * spread
+            primitive = primitive._replace(coords=(x1 + dx, y1 + dy, x2 + dx, y2 + dy))
+        moved.append(primitive)
+    return tuple(moved)
+
+
+def _merge_arms(primitives, layer, role):
+    """Join opposite arms that touch at the center (offset 0) into one line"""
+    by_arm = {primitive.slot.rsplit('_', 1)[1]: primitive for primitive in primitives}
+    merged = []
+    for axis, (first, second) in (('horizontal', ('right', 'left')), ('vertical', ('down', 'up'))):
+        a, b = by_arm.get(first), by_arm.get(second)
+        if a is not None and b is not None and a.coords[:2] == (0, 0) and b.coords[:2] == (0, 0):
+            merged.append(a._replace(slot=f'{layer}_{role}_{axis}',
+                                     coords=(b.coords[2], b.coords[3], a.coords[2], a.coords[3])))
+        else:
+            merged.extend(primitive for primitive in (a, b) if primitive is not None)
+    return merged
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def merge_plan(plan):
+    """Rewrite a plan into the fewest Tk items that draw the same picture
+
+    An outlined center dot becomes one oval whose outline is the dot's
+    outline ring, and opposite arms that meet at the center become a single
+    line. Arm fill/outline pairs stay separate: a Tk outline would also cap
+    the arm ends, which the original outline does not.
+    """
+    merged = []
+    groups = {}
+    for primitive in plan:
+        groups.setdefault((primitive.layer, primitive.role), []).append(primitive)
+    for (layer, role), primitives in groups.items():
+        if layer == 'dot':
+            continue
+        merged.extend(_merge_arms(primitives, layer, role))
+
+    dots = {primitive.role: primitive for primitive in groups.get(('dot', 'outline'), []) + groups.get(('dot', 'fill'), [])}
+    if 'outline' in dots:
+        outline, fill = dots['outline'], dots['fill']
+        ring = (outline.coords[2] - fill.coords[2])
+        # Tk strokes the outline centered on the oval's edge, so the edge sits
+        # half a ring outside the fill and the stroke covers the whole ring
+        radius = fill.coords[2] + ring / 2
+        merged.append(Primitive('dot_outlined', 'dot', 'fill', 'oval',
+                                (-radius, -radius, radius, radius), fill.fill, outline.fill, ring))
+    elif 'fill' in dots:
+        merged.append(dots['fill'])
+    return tuple(merged)
+
+
+class CanvasRenderer:
+    """Retained-mode Tk canvas backend for render plans
+
+    Every line and oval is created once and tagged by layer ('outer',
+    'inner', 'dot') and role ('<layer>_fill', '<layer>_outline'). Redraws
+    compare the wanted coordinates and options with what the canvas already
+    has and only send coords/itemconfigure for items that differ; disabled
+    parts are hidden with state='hidden' instead of being deleted.
+    """
+
+    ARM_SLOTS = ARMS
+    DOT_SLOTS = {'outline': ('dot_outline',), 'fill': ('dot_fill',)}
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.items = {}
+        self._coords = {}
+        self._options = {}
+        self._layer_hidden = {}
+        self._layer_of = {}
+        self._create_items()
+
+    def _slots(self):
+        """(slot, layer, role, kind) for every item, in stacking order"""
+        # Outer lines behind inner lines, center dot on top, each outline
+        # behind its fill
+        for layer in LAYERS:
+            for role in ('outline', 'fill'):
+                if layer == 'dot':
+                    for slot in self.DOT_SLOTS[role]:
+                        yield slot, layer, role, 'oval'
+                else:
+                    for arm in self.ARM_SLOTS:
+                        yield f'{layer}_{role}_{arm}', layer, role, 'line'
+
+    def _create_items(self):
+        create = {'line': self.canvas.create_line, 'oval': self.canvas.create_oval}
+        for slot, layer, role, kind in self._slots():
+            item = create[kind](0, 0, 0, 0, tags=(layer, f'{layer}_{role}'), state='hidden')
+            self._add_item(slot, layer, item)
+
+    def _add_item(self, slot, layer, item):
+        self.items[slot] = item
+        self._layer_of[slot] = layer
+        self._coords[slot] = (0, 0, 0, 0)
+        self._options[slot] = {'state': 'hidden'}
+        self._layer_hidden[layer] = True
+
+    def _set_coords(self, item, coords):
+        self.canvas.coords(item, *coords)
+
+    def _configure(self, item, options):
+        self.canvas.itemconfigure(item, **options)
+
+    def _commit(self):
+        """Hook for backends that queue canvas commands instead of sending them"""
+
+    def render(self, plan, center_x, center_y, layers=None):
+        """Bring the canvas items in line with a render plan, touching only what changed
+
+        layers restricts the comparison to items of those layers, for callers
+        that know which layers a settings change can have affected.
+        """
+        visible_layers = {primitive.layer for primitive in plan}
+        layers = LAYERS if layers is None else layers
+
+        for layer in layers:
+            if layer not in visible_layers:
+                # A disabled layer is a single state flip on its tag
+                if not self._layer_hidden[layer]:
+                    self._configure(layer, {'state': 'hidden'})
+                    self._layer_hidden[layer] = True
+                    for slot in self.items:
+                        if self._layer_of[slot] == layer:
+                            self._options[slot]['state'] = 'hidden'
+                continue
+            self._layer_hidden[layer] = False
+
+        specs = {primitive.slot: primitive for primitive in plan}
+        for slot, item in self.items.items():
+            if self._layer_of[slot] not in layers:
+                continue
+            primitive = specs.get(slot)
+            current = self._options[slot]
+            if primitive is None:
+                if current.get('state') != 'hidden':
+                    self._configure(item, {'state': 'hidden'})
+                    current['state'] = 'hidden'
+                continue
+            x1, y1, x2, y2 = primitive.coords
+            coords = (center_x + x1, center_y + y1, center_x + x2, center_y + y2)
+            if self._coords[slot] != coords:
+                self._set_coords(item, coords)
+                self._coords[slot] = coords
+            if primitive.kind == 'oval':
+                options = {'fill': primitive.fill, 'outline': primitive.outline, 'width': primitive.width}
+            else:
+                options = {'fill': primitive.fill, 'width': primitive.width}
+            changed = {key: value for key, value in options.items() if current.get(key) != value}
+            if current.get('state') != 'normal':
+                changed['state'] = 'normal'
+            if changed:
+                self._configure(item, changed)
+                current.update(changed)
+        self._commit()
+
+
+_TCL_SPECIAL = re.compile(r'([\s\\{}\[\]$;"])')
+
+
+def _tcl_word(value):
+    """Quote a value as a single Tcl word by backslash-escaping special characters"""
+    return _TCL_SPECIAL.sub(r'\\\1', str(value))
+
+
+class BatchedCanvasRenderer(CanvasRenderer):
+    """CanvasRenderer that sends each redraw to Tcl as one script
+
+    Item creation and every coords/itemconfigure of a redraw are collected as
+    Tcl commands and evaluated in a single call, and plans are merged with
+    merge_plan first so fewer items need updating.
+    """
+
+    ARM_SLOTS = ARMS + ('horizontal', 'vertical')
+    DOT_SLOTS = {'outline': ('dot_outline',), 'fill': ('dot_fill', 'dot_outlined')}
+
+    def __init__(self, canvas):
+        self.path = str(canvas)
+        self.round_trips = 0
+        self._script = []
+        super().__init__(canvas)
+
+    def _create_items(self):
+        slots = list(self._slots())
+        commands = [f'{self.path} create {kind} 0 0 0 0 -tags {{{layer} {layer}_{role}}} -state hidden'
+                    for _, layer, role, kind in slots]
+        ids = self.canvas.tk.splitlist(self.canvas.tk.eval('list ' + ' '.join(f'[{command}]' for command in commands)))
+        self.round_trips += 1
+        for (slot, layer, _, _), item in zip(slots, ids):
+            self._add_item(slot, layer, int(item))
+
+    def _set_coords(self, item, coords):
+        self._script.append(f'{self.path} coords {item} ' + ' '.join(map(str, coords)))
+
+    def _configure(self, item, options):
+        self._script.append(f'{self.path} itemconfigure {item} '
+                            + ' '.join(f'-{key} {_tcl_word(value)}' for key, value in options.items()))
+
+    def _commit(self):
+        if self._script:
+            self.canvas.tk.eval('\n'.join(self._script))
+            self.round_trips += 1
+            self._script = []
+
+    def render(self, plan, center_x, center_y, layers=None):
+        super().render(merge_plan(plan), center_x, center_y, layers)
@@ -0,0 +1,63 @@
+import time
+
+
+class RedrawScheduler:
+    """Coalesce redraw requests into at most one render per frame
+
+    Trace callbacks call request() with the kinds of work they need
+    ('crosshair', 'alpha', ...). The flags are merged until the next frame
+    slot, which runs from after_idle once Tk has finished handling the
+    current burst of events, or from after() when the previous frame was
+    too recent for max_fps.
+    """
+
+    def __init__(self, widget, render, max_fps=120):
+        self.widget = widget
+        self.render = render
+        self.max_fps = max_fps
+        self.requests = 0
+        self.renders = 0
+        self._dirty = set()
+        self._pending = None
+        self._last_frame = 0.0
+
+    @property
+    def frame_interval(self):
+        return 1.0 / self.max_fps if self.max_fps > 0 else 0.0
+
+    @property
+    def collapsed(self):
+        """Number of redraw requests absorbed into an already scheduled frame"""
+        return self.requests - self.renders - (1 if self._pending else 0)
+
+    def request(self, *flags):
+        """Mark flags dirty and make sure a frame is scheduled"""
+        self.requests += 1
+        self._dirty.update(flags)
+        if self._pending is not None:
+            return
+        wait = self._last_frame + self.frame_interval - time.perf_counter()
+        if wait > 0:
+            self._pending = self.widget.after(max(1, round(wait * 1000)), self._frame)
+        else:
+            self._pending = self.widget.after_idle(self._frame)
+
+    def flush(self):
+        """Render pending work right now instead of waiting for the frame slot"""
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._frame()
+
+    def cancel(self):
+        """Drop any scheduled frame and pending flags"""
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._pending = None
+        self._dirty.clear()
+
+    def _frame(self):
+        self._pending = None
+        flags, self._dirty = self._dirty, set()
+        self._last_frame = time.perf_counter()
+        self.renders += 1
+        self.render(flags)
@@ -0,0 +1,39 @@
+"""Declarative description of the settings window
+
+Each section lists the config keys it edits, in display order, with the
+kind of control and the slider range. The section name is the render
+layer its keys affect (see settings.KEY_LAYERS), or 'alpha' for opacity.
+"""
+from collections import namedtuple
+
+# kind is 'bool' (checkbox), 'int' (slider + entry), 'color' (RGB sliders)
+# or 'percent' (a 0..1 value edited as a percentage slider)
+Field = namedtuple('Field', 'key label kind low high', defaults=(None, None))
+Section = namedtuple('Section', 'name title fields')
+
+SECTIONS = (
+    Section('inner', "INNER LINES", (
+        Field('inner_enabled', "Enable Inner Lines", 'bool'),
+        Field('inner_length', "Length:", 'int', 1, 50),
+        Field('inner_thickness', "Thickness:", 'int', 1, 10),
+        Field('inner_offset', "Offset:", 'int', 0, 20),
+        Field('inner_color', None, 'color', 0, 255),
+        Field('inner_outline_enabled', "Enable Outline", 'bool'),
+    )),
+    Section('outer', "OUTER LINES", (
+        Field('outer_enabled', "Enable Outer Lines", 'bool'),
+        Field('outer_length', "Length:", 'int', 1, 50),
+        Field('outer_thickness', "Thickness:", 'int', 1, 10),
+        Field('outer_offset', "Offset:", 'int', 0, 30),
+        Field('outer_color', None, 'color', 0, 255),
+    )),
+    Section('dot', "CENTER DOT", (
+        Field('center_dot_enabled', "Enable Center Dot", 'bool'),
+        Field('center_dot_size', "Size:", 'int', 1, 10),
+    )),
+    Section('alpha', "GENERAL", (
+        Field('opacity', "Opacity (%):", 'percent', 0, 100),
+    )),
+)
+
+FIELDS = {field.key: field for section in SECTIONS for field in section.fields}
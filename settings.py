@@ -0,0 +1,211 @@
+from dataclasses import dataclass, fields, replace
+from tkinter import TclError
+
+from render import LAYERS
+
+SECTION = 'crosshair'
+
+
+def parse_bool(value):
+    """Parse a config boolean the same way ConfigParser.getboolean does"""
+    if isinstance(value, bool):
+        return value
+    try:
+        return {'1': True, 'yes': True, 'true': True, 'on': True,
+                '0': False, 'no': False, 'false': False, 'off': False}[str(value).lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value!r}")
+
+
+def parse_int(value):
+    """Parse a config integer, tolerating values written as floats"""
+    return int(float(value))
+
+
+def parse_color(value):
+    """Parse a config color; lowercased so '#FF0000' and '#ff0000' compare equal"""
+    return str(value).lower()
+
+
+@dataclass(frozen=True, slots=True)
+class CrosshairSettings:
+    """Immutable, pre-parsed view of the [crosshair] section used for drawing"""
+
+    # Inner lines
+    inner_enabled: bool = True
+    inner_length: int = 15
+    inner_thickness: int = 2
+    inner_offset: int = 3
+    inner_color: str = '#ff0000'
+    inner_outline_enabled: bool = True
+    inner_outline_thickness: int = 1
+    inner_outline_color: str = '#000000'
+
+    # Outer lines
+    outer_enabled: bool = True
+    outer_length: int = 25
+    outer_thickness: int = 2
+    outer_offset: int = 8
+    outer_color: str = '#ff0000'
+    outer_outline_enabled: bool = True
+    outer_outline_thickness: int = 1
+    outer_outline_color: str = '#000000'
+
+    # Center dot
+    center_dot_enabled: bool = False
+    center_dot_size: int = 3
+    center_dot_color: str = '#ff0000'
+    center_dot_outline_enabled: bool = True
+    center_dot_outline_thickness: int = 1
+    center_dot_outline_color: str = '#000000'
+
+    # General
+    opacity: float = 0.8
+
+    @classmethod
+    def from_config(cls, config, section=SECTION):
+        """Build a snapshot from a ConfigParser section, keeping defaults for missing keys"""
+        values = {}
+        for key in FIELD_PARSERS:
+            if config.has_option(section, key):
+                values[key] = FIELD_PARSERS[key](config.get(section, key))
+        return cls(**values)
+
+    def with_option(self, key, value):
+        """Return a snapshot with one raw config value applied
+
+        Returns self unchanged when the key is not a drawing setting or the
+        parsed value is identical, so callers can cheaply detect real changes.
+        """
+        parser = FIELD_PARSERS.get(key)
+        if parser is None:
+            return self
+        parsed = parser(value)
+        if getattr(self, key) == parsed:
+            return self
+        return replace(self, **{key: parsed})
+
+
+_TYPE_PARSERS = {bool: parse_bool, int: parse_int, float: float, str: parse_color}
+FIELD_PARSERS = {f.name: _TYPE_PARSERS[f.type] for f in fields(CrosshairSettings)}
+
+
+def _key_layer(key):
+    if key == 'opacity':
+        return 'alpha'
+    if key.startswith('center_dot_'):
+        return 'dot'
+    return key.split('_', 1)[0]
+
+
+# Layer each config key affects when it changes: a render layer ('inner',
+# 'outer', 'dot') or 'alpha' for the overlay window's opacity
+KEY_LAYERS = {key: _key_layer(key) for key in FIELD_PARSERS}
+
+def changed_layers(old, new):
+    """Layers (see KEY_LAYERS) whose keys differ between two snapshots"""
+    return {KEY_LAYERS[key] for key in FIELD_PARSERS if getattr(old, key) != getattr(new, key)}
+
+
+# Keys an older settings sweep wrote for the RGB sliders; they have no meaning
+LEGACY_KEYS = ('inner_red', 'inner_green', 'inner_blue', 'outer_red', 'outer_green', 'outer_blue')
+
+
+def rgb_to_hex(r, g, b):
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def color_to_int(color):
+    """Pack '#rrggbb' into a 24-bit integer (unparseable colors become red)"""
+    value = color.lstrip('#')
+    if len(value) == 6:
+        try:
+            return int(value, 16)
+        except ValueError:
+            pass
+    return 0xFF0000
+
+
+def int_to_color(value):
+    return f"#{value:06x}"
+
+
+def opacity_from_percent(percent):
+    # Minimum 1% to keep window visible
+    return f"{max(0.01, percent / 100.0):.2f}"
+
+
+def percent_from_opacity(opacity):
+    return (max(0, min(100, int(round(opacity * 100)))),)
+
+
+class SettingsModel:
+    """Binds widget variables to config keys and tracks what each change touches
+
+    Each binding maps one or more Tk variables (e.g. the three RGB sliders of
+    a color) to exactly one config key. When a variable is written only that
+    key is recomputed and passed to apply(key, value), which returns True if
+    the value really changed; then the key's layer is reported through
+    mark_dirty(layer).
+    """
+
+    def __init__(self, apply, mark_dirty):
+        self.apply = apply
+        self.mark_dirty = mark_dirty
+        self.bindings = {}
+        self._muted = False
+        self.variable_count = 0
+        self.changes = 0
+        self.keys_written = 0
+        self.layers_marked = 0
+
+    def bind(self, key, *variables, convert=str, split=None):
+        """Write convert(*values) to key whenever any of the variables changes
+
+        split is the inverse of convert, turning a typed setting back into
+        one value per variable for push(); by default the value is used as is.
+        """
+        self.bindings[key] = (variables, convert, split or (lambda value: (value,)))
+        self.variable_count += len(variables)
+        for variable in variables:
+            variable.trace_add('write', lambda *args: self.changed(key))
+
+    def push(self, settings):
+        """Show a CrosshairSettings snapshot in the bound variables without echoing it back"""
+        self._muted = True
+        try:
+            for key, (variables, convert, split) in self.bindings.items():
+                for variable, value in zip(variables, split(getattr(settings, key))):
+                    try:
+                        current = variable.get()
+                    except TclError:
+                        current = None
+                    if current != value:
+                        variable.set(value)
+        finally:
+            self._muted = False
+
+    def changed(self, key):
+        if self._muted:
+            return
+        variables, convert, split = self.bindings[key]
+        try:
+            value = convert(*(variable.get() for variable in variables))
+        except (TclError, ValueError):
+            # Half-typed entry text; wait for a parseable value
+            return
+        self.changes += 1
+        if self.apply(key, value):
+            self.keys_written += 1
+            self.layers_marked += 1
+            self.mark_dirty(KEY_LAYERS.get(key, 'crosshair'))
+
+    def stats(self):
+        """Work done so far next to what a write-everything sweep would have cost"""
+        return {
+            'changes': self.changes,
+            'keys_written': self.keys_written,
+            'layers_marked': self.layers_marked,
+            'sweep_keys_written': self.changes * self.variable_count,
+            'sweep_layers_marked': self.changes * (len(LAYERS) + 1),
+        }
@@ -0,0 +1,150 @@
+"""Compact share codes for crosshair looks
+
+A share code packs every drawing setting into one integer: booleans take a
+bit each, numbers only the bits their allowed range needs and colors 24
+bits. The low byte is a checksum and the byte above it the format version,
+so a decoder can pick the layout before reading anything else. The integer
+is written in base 58, an alphabet without look-alike characters.
+
+Numbers must lie within the settings window's slider ranges (see
+schema.py); decoding rejects anything else, so an imported code can always
+be shown and edited in the settings window.
+"""
+import zlib
+
+from schema import FIELDS
+from settings import CrosshairSettings, int_to_color, opacity_from_percent
+
+VERSION = 1
+ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+_DIGITS = {char: value for value, char in enumerate(ALPHABET)}
+
+# Limits for numbers that have no slider in the settings window
+EXTRA_LIMITS = {
+    'inner_outline_thickness': (0, 10),
+    'outer_outline_thickness': (0, 10),
+    'center_dot_outline_thickness': (0, 10),
+}
+
+# Version 1 field order, most significant first: (key, kind)
+LAYOUT_V1 = (
+    ('inner_enabled', 'bool'), ('inner_outline_enabled', 'bool'),
+    ('outer_enabled', 'bool'), ('outer_outline_enabled', 'bool'),
+    ('center_dot_enabled', 'bool'), ('center_dot_outline_enabled', 'bool'),
+    ('inner_length', 'int'), ('inner_thickness', 'int'), ('inner_offset', 'int'),
+    ('inner_outline_thickness', 'int'),
+    ('outer_length', 'int'), ('outer_thickness', 'int'), ('outer_offset', 'int'),
+    ('outer_outline_thickness', 'int'),
+    ('center_dot_size', 'int'), ('center_dot_outline_thickness', 'int'),
+    ('opacity', 'percent'),
+    ('inner_color', 'color'), ('inner_outline_color', 'color'),
+    ('outer_color', 'color'), ('outer_outline_color', 'color'),
+    ('center_dot_color', 'color'), ('center_dot_outline_color', 'color'),
+)
+
+
+def limits(key, kind):
+    """(low, high) accepted for a field"""
+    if kind == 'bool':
+        return 0, 1
+    if kind == 'color':
+        return 0, 0xFFFFFF
+    field = FIELDS.get(key)
+    if field is not None:
+        return field.low, field.high
+    return EXTRA_LIMITS[key]
+
+
+def _compile_layout(layout):
+    """Add (low, high, bits) to each field, least significant field first"""
+    fields = []
+    for key, kind in layout:
+        low, high = limits(key, kind)
+        fields.append((key, kind, low, high, (high - low).bit_length()))
+    return tuple(reversed(fields))
+
+
+_LAYOUTS = {1: _compile_layout(LAYOUT_V1)}
+
+
+def _checksum(value):
+    return zlib.crc32(value.to_bytes((value.bit_length() + 7) // 8 or 1, 'big')) & 0xFF
+
+
+def _number(settings, key, kind):
+    value = getattr(settings, key)
+    if kind == 'color':
+        if len(value) != 7 or not value.startswith('#'):
+            raise ValueError(f"{key} = {value!r} is not a #rrggbb color")
+        return int(value[1:], 16)
+    if kind == 'percent':
+        return round(value * 100)
+    return int(value)
+
+
+def encode(settings):
+    """Share code for a CrosshairSettings; ValueError if a value is out of range"""
+    value = 0
+    for key, kind, low, high, bits in reversed(_LAYOUTS[VERSION]):
+        number = _number(settings, key, kind)
+        if not low <= number <= high:
+            raise ValueError(f"{key} = {number} is outside the shareable range {low}..{high}")
+        value = (value << bits) | (number - low)
+    value = (value << 8) | VERSION
+    value = (value << 8) | _checksum(value)
+
+    digits = []
+    while value:
+        value, digit = divmod(value, 58)
+        digits.append(ALPHABET[digit])
+    return ''.join(reversed(digits))
+
+
+def decode(code):
+    """CrosshairSettings for a share code; ValueError if it is malformed or out of range"""
+    code = code.strip()
+    if not code:
+        raise ValueError("Share code is empty")
+    value = 0
+    for char in code:
+        digit = _DIGITS.get(char)
+        if digit is None:
+            raise ValueError(f"Invalid character {char!r} in share code")
+        value = value * 58 + digit
+
+    checksum = value & 0xFF
+    value >>= 8
+    if _checksum(value) != checksum:
+        raise ValueError("Share code checksum mismatch (mistyped or truncated?)")
+    version = value & 0xFF
+    value >>= 8
+    layout = _LAYOUTS.get(version)
+    if layout is None:
+        raise ValueError(f"Unsupported share code version {version}")
+
+    values = {}
+    for key, kind, low, high, bits in layout:
+        number = (value & ((1 << bits) - 1)) + low
+        value >>= bits
+        if number > high:
+            raise ValueError(f"{key} = {number} is outside the allowed range {low}..{high}")
+        if kind == 'bool':
+            values[key] = bool(number)
+        elif kind == 'color':
+            values[key] = int_to_color(number)
+        elif kind == 'percent':
+            values[key] = float(opacity_from_percent(number))
+        else:
+            values[key] = number
+    if value:
+        raise ValueError("Share code has trailing data")
+    return CrosshairSettings(**values)
+
+
+def config_values(settings):
+    """Config strings for every drawing key of settings, as the settings window writes them"""
+    values = {}
+    for key, kind in LAYOUT_V1:
+        value = getattr(settings, key)
+        values[key] = opacity_from_percent(value * 100) if kind == 'percent' else str(value)
+    return values
@@ -0,0 +1,104 @@
+"""Fixed-layout settings record shared between processes
+
+The settings UI process publishes CrosshairSettings plus a few control fields
+into a multiprocessing.shared_memory block; the overlay process polls it.
+Writes follow a seqlock: the sequence counter is odd while a write is in
+progress and even once it is complete, so a reader that sees the same even
+value before and after copying the payload has a consistent record.
+"""
+import logging
+import struct
+from dataclasses import fields
+from multiprocessing import shared_memory
+
+from settings import CrosshairSettings, color_to_int, int_to_color
+
+logger = logging.getLogger(__name__)
+
+_FIELD_FORMATS = {bool: '?', int: 'i', float: 'd', str: 'I'}
+SETTINGS_FIELDS = [f.name for f in fields(CrosshairSettings)]
+_COLOR_FIELDS = {f.name for f in fields(CrosshairSettings) if f.type is str}
+
+SEQUENCE = struct.Struct('<Q')
+# toggles counts toggle requests; quit asks the overlay process to exit
+PAYLOAD = struct.Struct('<' + ''.join(_FIELD_FORMATS[f.type] for f in fields(CrosshairSettings)) + 'I?')
+RECORD_SIZE = SEQUENCE.size + PAYLOAD.size
+
+
+def pack_settings(settings):
+    return [color_to_int(getattr(settings, name)) if name in _COLOR_FIELDS else getattr(settings, name)
+            for name in SETTINGS_FIELDS]
+
+
+def unpack_settings(values):
+    return CrosshairSettings(**{
+        name: int_to_color(value) if name in _COLOR_FIELDS else value
+        for name, value in zip(SETTINGS_FIELDS, values)
+    })
+
+
+class SharedSettingsWriter:
+    """Owns the shared block and publishes records into it"""
+
+    def __init__(self):
+        self.shm = shared_memory.SharedMemory(create=True, size=RECORD_SIZE)
+        self.name = self.shm.name
+        self.sequence = 0
+        self.toggles = 0
+        self.publishes = 0
+        self._settings = None
+        SEQUENCE.pack_into(self.shm.buf, 0, 0)
+
+    def publish(self, settings=None, toggle=False, quit=False):
+        """Write a new record; settings=None republishes the last settings
+
+        Settings that don't fit the record (e.g. an out-of-range number typed
+        into an entry) are logged and not published; the last record stays.
+        """
+        if settings is None:
+            settings = self._settings
+        toggles = self.toggles + 1 if toggle else self.toggles
+        # Pack before touching the block, so a failure never leaves the sequence odd
+        try:
+            payload = PAYLOAD.pack(*pack_settings(settings), toggles, quit)
+        except struct.error as error:
+            logger.warning("Not publishing settings the overlay record cannot hold: %s", error)
+            return
+        self._settings = settings
+        self.toggles = toggles
+        buf = self.shm.buf
+        SEQUENCE.pack_into(buf, 0, self.sequence + 1)
+        buf[SEQUENCE.size:RECORD_SIZE] = payload
+        self.sequence += 2
+        SEQUENCE.pack_into(buf, 0, self.sequence)
+        self.publishes += 1
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+class SharedSettingsReader:
+    """Attaches to a writer's block; poll() is a single 8-byte read when nothing changed"""
+
+    def __init__(self, name):
+        self.shm = shared_memory.SharedMemory(name=name)
+        self.sequence = 0
+        self.torn_reads = 0
+
+    def poll(self):
+        """Return (settings, toggles, quit) for a new complete record, else None"""
+        buf = self.shm.buf
+        (sequence,) = SEQUENCE.unpack_from(buf, 0)
+        if sequence == self.sequence or sequence & 1:
+            return None
+        values = PAYLOAD.unpack_from(buf, SEQUENCE.size)
+        if SEQUENCE.unpack_from(buf, 0)[0] != sequence:
+            # Overwritten while we copied it; take the next one on the next poll
+            self.torn_reads += 1
+            return None
+        self.sequence = sequence
+        return unpack_settings(values[:-2]), values[-2], values[-1]
+
+    def close(self):
+        self.shm.close()
@@ -0,0 +1,164 @@
+"""Cheap change detection for config.ini, polled from a Tk after() timer
+
+PollingBackend compares the file's (mtime, size, inode) signature; on Linux
+InotifyBackend reads queued directory events from a non-blocking inotify
+descriptor instead; where Tk supports file handlers (not on Windows) the
+descriptor is watched by the Tk event loop itself, so nothing is polled at
+all. Either way the file is only re-read when it actually changed.
+"""
+import ctypes
+import logging
+import os
+import struct
+import sys
+
+logger = logging.getLogger(__name__)
+
+# tkinter.READABLE, without importing tkinter just for a constant
+_READABLE = 2
+
+
+def file_signature(path):
+    """(mtime_ns, size, inode) of path, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class PollingBackend:
+    def __init__(self, path):
+        self.path = path
+        self._signature = file_signature(path)
+
+    def changed(self):
+        signature = file_signature(self.path)
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        return True
+
+    def close(self):
+        pass
+
+
+class InotifyBackend:
+    """Watches the file's directory, which also catches atomic rename-over saves"""
+
+    IN_MODIFY = 0x002
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, path):
+        self.name = os.path.basename(path)
+        libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        directory = os.path.dirname(os.path.abspath(path))
+        mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE | self.IN_MODIFY
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            error = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(error, f"inotify_add_watch failed for {directory}")
+
+    @classmethod
+    def available(cls):
+        return sys.platform.startswith('linux')
+
+    def fileno(self):
+        return self.fd
+
+    def changed(self):
+        changed = False
+        while True:
+            try:
+                data = os.read(self.fd, 4096)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if os.fsdecode(name) == self.name:
+                    changed = True
+
+    def close(self):
+        os.close(self.fd)
+
+
+def default_backend(path):
+    if InotifyBackend.available():
+        try:
+            return InotifyBackend(path)
+        except OSError as error:
+            logger.info("inotify unavailable (%s), polling %s instead", error, path)
+    return PollingBackend(path)
+
+
+class ConfigWatcher:
+    """Calls on_change() when path changes, unless is_own(signature) says we wrote it"""
+
+    def __init__(self, widget, path, on_change, interval_ms=500, backend=None, is_own=None,
+                 idle_interval_ms=5000):
+        self.widget = widget
+        self.path = path
+        self.on_change = on_change
+        self.interval_ms = interval_ms
+        self.idle_interval_ms = idle_interval_ms
+        self.backend = backend or default_backend(path)
+        self.is_own = is_own or (lambda signature: False)
+        self.reloads = 0
+        self.ignored = 0
+        self.idle = False
+        self.event_driven = False
+        self._pending = None
+
+    def start(self):
+        fileno = getattr(self.backend, 'fileno', None)
+        createfilehandler = getattr(self.widget.tk, 'createfilehandler', None)
+        if fileno is not None and createfilehandler is not None:
+            # Tk wakes us only when the descriptor has events to read
+            createfilehandler(fileno(), _READABLE, lambda file, mask: self._check())
+            self.event_driven = True
+        else:
+            self._schedule()
+
+    def stop(self):
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._pending = None
+        if self.event_driven:
+            self.widget.tk.deletefilehandler(self.backend.fileno())
+            self.event_driven = False
+        self.backend.close()
+
+    def set_idle(self, idle):
+        """Poll every idle_interval_ms instead of interval_ms while the app is idle"""
+        if idle == self.idle:
+            return
+        self.idle = idle
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._schedule()
+
+    def _schedule(self):
+        interval = self.idle_interval_ms if self.idle else self.interval_ms
+        self._pending = self.widget.after(interval, self._poll)
+
+    def _poll(self):
+        self._check()
+        self._schedule()
+
+    def _check(self):
+        if self.backend.changed():
+            if self.is_own(file_signature(self.path)):
+                self.ignored += 1
+            else:
+                self.reloads += 1
+                self.on_change()